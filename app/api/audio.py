@@ -3,7 +3,7 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, File, Form, Request, UploadFile, status
+from fastapi import APIRouter, File, Form, Request, Response, UploadFile, status
 
 from app.models.audio import TranscriptionRequest, TranscriptionResponse, UploadResponse
 from app.models.common import ErrorResponse
@@ -110,16 +110,18 @@ async def upload_audio(
     """
     request_id = getattr(request.state, "request_id", "unknown")
 
-    logger.info(
-        "Audio upload started",
-        extra={
-            "request_id": request_id,
-            "upload_filename": file.filename,
-            "content_type": file.content_type,
-            "file_size": getattr(file, "size", "unknown"),
-            "session_id": session_id,
-        },
-    )
+    # Skip building the extra payload when INFO logging is off
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Audio upload started",
+            extra={
+                "request_id": request_id,
+                "upload_filename": file.filename,
+                "content_type": file.content_type,
+                "file_size": getattr(file, "size", "unknown"),
+                "session_id": session_id,
+            },
+        )
 
     # Process the upload - exceptions will be handled by middleware
     upload_data = await upload_service.process_upload(file)
@@ -152,15 +154,16 @@ async def upload_audio(
                 extra={"request_id": request_id, "session_id": session_id},
             )
 
-    logger.info(
-        "Audio upload completed",
-        extra={
-            "request_id": request_id,
-            "upload_id": upload_data["upload_id"],
-            "stored_filename": upload_data["filename"],
-            "file_size": upload_data["file_size"],
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Audio upload completed",
+            extra={
+                "request_id": request_id,
+                "upload_id": upload_data["upload_id"],
+                "stored_filename": upload_data["filename"],
+                "file_size": upload_data["file_size"],
+            },
+        )
 
     return UploadResponse(**upload_data)
 
@@ -255,7 +258,7 @@ async def upload_audio(
 async def transcribe_audio(
     request: Request,
     transcription_request: TranscriptionRequest,
-) -> TranscriptionResponse:
+) -> Response:
     """
     Transcribe an uploaded audio file using Whisper AI.
 
@@ -346,28 +349,32 @@ async def transcribe_audio(
                 },
             )
 
-    logger.info(
-        "Transcription completed successfully",
-        extra={
-            "request_id": request_id,
-            "upload_id": upload_id,
-            "processing_time": transcription_data["processing_time_seconds"],
-            "text_length": len(transcription_data["transcription"]["text"]),
-            "detected_language": transcription_data["transcription"]["language"],
-            "summary_included": transcription_data.get("summary") is not None,
-            "summary_processing_time": transcription_data.get(
-                "summary_processing_time"
-            ),
-            "keywords_extracted": transcription_data.get("keywords") is not None,
-            "keyword_count": (
-                len(transcription_data["keywords"])
-                if transcription_data.get("keywords")
-                else 0
-            ),
-            "keyword_processing_time": transcription_data.get(
-                "keyword_processing_time"
-            ),
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Transcription completed successfully",
+            extra={
+                "request_id": request_id,
+                "upload_id": upload_id,
+                "processing_time": transcription_data["processing_time_seconds"],
+                "text_length": len(transcription_data["transcription"]["text"]),
+                "detected_language": transcription_data["transcription"]["language"],
+                "summary_included": transcription_data.get("summary") is not None,
+                "summary_processing_time": transcription_data.get(
+                    "summary_processing_time"
+                ),
+                "keywords_extracted": transcription_data.get("keywords") is not None,
+                "keyword_count": (
+                    len(transcription_data["keywords"])
+                    if transcription_data.get("keywords")
+                    else 0
+                ),
+                "keyword_processing_time": transcription_data.get(
+                    "keyword_processing_time"
+                ),
+            },
+        )
 
-    return TranscriptionResponse(**transcription_data)
+    # Validate once, then serialize straight to JSON bytes (pydantic-core) instead
+    # of round-tripping through jsonable_encoder and the stdlib json encoder.
+    response = TranscriptionResponse(**transcription_data)
+    return Response(content=response.model_dump_json(), media_type="application/json")
@@ -2,13 +2,15 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 
 from app.models.common import SuccessResponse
 from app.models.session import (
     DraftData,
     SessionCreateRequest,
     SessionResponse,
+    SessionState,
     SessionUpdateRequest,
 )
 from app.services.session_manager import (
@@ -23,6 +25,22 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/sessions", tags=["sessions"])
 
 
+def _session_response(
+    session_state: SessionState, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize session state straight to JSON bytes.
+
+    Validates once from the state's attributes and lets pydantic-core write the
+    JSON, skipping the dict round-trip, jsonable_encoder and the stdlib encoder.
+    """
+    response = SessionResponse.model_validate(session_state, from_attributes=True)
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @router.post(
     "/",
     response_model=SessionResponse,
@@ -32,7 +50,7 @@ router = APIRouter(prefix="/api/v1/sessions", tags=["sessions"])
 )
 async def create_session(
     request: Request, session_request: SessionCreateRequest = SessionCreateRequest()
-) -> SessionResponse:
+) -> Response:
     """Create new session for voice processing workflow."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -41,7 +59,7 @@ async def create_session(
     session_id = await session_manager.create_session()
     session_state = await session_manager.get_session_state(session_id)
 
-    return SessionResponse(**session_state.model_dump())
+    return _session_response(session_state, status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -51,7 +69,7 @@ async def create_session(
     summary="Get session state",
     description="Retrieve current state of session",
 )
-async def get_session(request: Request, session_id: str) -> SessionResponse:
+async def get_session(request: Request, session_id: str) -> Response:
     """Get session state by ID."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -62,7 +80,7 @@ async def get_session(request: Request, session_id: str) -> SessionResponse:
 
     try:
         session_state = await session_manager.get_session_state(session_id)
-        return SessionResponse(**session_state.model_dump())
+        return _session_response(session_state)
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SessionExpiredError as e:
@@ -84,7 +102,7 @@ async def get_session(request: Request, session_id: str) -> SessionResponse:
 )
 async def update_session(
     request: Request, session_id: str, update_request: SessionUpdateRequest
-) -> SessionResponse:
+) -> Response:
     """Update session with new data."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -98,7 +116,7 @@ async def update_session(
         session_state = await session_manager.update_session_data(
             session_id, **update_data
         )
-        return SessionResponse(**session_state.model_dump())
+        return _session_response(session_state)
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SessionExpiredError as e:
@@ -112,7 +130,7 @@ async def update_session(
     summary="Delete session",
     description="Delete session and cleanup associated data",
 )
-async def delete_session(request: Request, session_id: str) -> SuccessResponse:
+async def delete_session(request: Request, session_id: str) -> Response:
     """Delete session and cleanup data."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -126,11 +144,12 @@ async def delete_session(request: Request, session_id: str) -> SuccessResponse:
     if not success:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    return SuccessResponse(
+    response = SuccessResponse(
         success=True,
         message=f"Session {session_id} deleted successfully",
         request_id=request_id,
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -140,24 +159,29 @@ async def delete_session(request: Request, session_id: str) -> SuccessResponse:
     summary="Check session status",
     description="Quick session status check",
 )
-async def get_session_status(request: Request, session_id: str) -> dict:
+async def get_session_status(request: Request, session_id: str) -> JSONResponse:
     """Get session status quickly."""
     is_valid = await session_manager.validate_session(session_id)
 
+    # Already JSON-ready, so skip the response_model pass and jsonable_encoder
     if not is_valid:
-        return {
-            "session_id": session_id,
-            "valid": False,
-            "status": "expired_or_missing",
-        }
+        return JSONResponse(
+            {
+                "session_id": session_id,
+                "valid": False,
+                "status": "expired_or_missing",
+            }
+        )
 
     session_state = await session_manager.get_session_state(session_id)
-    return {
-        "session_id": session_id,
-        "valid": True,
-        "status": session_state.status,
-        "expires_at": session_state.expires_at.isoformat(),
-    }
+    return JSONResponse(
+        {
+            "session_id": session_id,
+            "valid": True,
+            "status": session_state.status,
+            "expires_at": session_state.expires_at.isoformat(),
+        }
+    )
 
 
 @router.patch(
@@ -167,9 +191,7 @@ async def get_session_status(request: Request, session_id: str) -> dict:
     summary="Update session draft",
     description="Update draft data for editing session",
 )
-async def update_draft(
-    request: Request, session_id: str, draft: DraftData
-) -> SessionResponse:
+async def update_draft(request: Request, session_id: str, draft: DraftData) -> Response:
     """Update session draft data."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -182,7 +204,7 @@ async def update_draft(
         session_state = await session_manager.update_session_data(
             session_id, draft=draft
         )
-        return SessionResponse(**session_state.model_dump())
+        return _session_response(session_state)
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SessionExpiredError as e:
@@ -196,7 +218,7 @@ async def update_draft(
     summary="Preview session markdown",
     description="Generate markdown preview from current session data",
 )
-async def preview_markdown(request: Request, session_id: str) -> dict:
+async def preview_markdown(request: Request, session_id: str) -> JSONResponse:
     """Generate markdown preview from session data."""
     request_id = getattr(request.state, "request_id", "unknown")
 
@@ -239,12 +261,14 @@ async def preview_markdown(request: Request, session_id: str) -> dict:
             },
         )
 
-        return {
-            "session_id": session_id,
-            "markdown": markdown_content,
-            "character_count": len(markdown_content),
-            "word_count": len(markdown_content.split()),
-        }
+        return JSONResponse(
+            {
+                "session_id": session_id,
+                "markdown": markdown_content,
+                "character_count": len(markdown_content),
+                "word_count": len(markdown_content.split()),
+            }
+        )
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except SessionExpiredError as e:
@@ -35,13 +35,13 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         """Log request details and response time."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Process request
         response = await call_next(request)
 
         # Calculate processing time
-        process_time = (time.time() - start_time) * 1000  # Convert to ms
+        process_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
 
         # Add processing time header
         response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
@@ -27,6 +27,10 @@ class Settings(BaseSettings):
     obsidian_vault_path: Path = Field(
         default=Path("/vault"), description="Path to Obsidian vault"
     )
+    vault_direct_io: bool = Field(
+        default=False,
+        description="Write vault files with O_DIRECT, bypassing the page cache",
+    )
     upload_dir: Path = Field(
         default=Path("/tmp/voice-notes/uploads"),
         description="Directory for temporary upload storage",
@@ -69,7 +73,18 @@ class Settings(BaseSettings):
     )
     whisper_compute_type: str = Field(
         default="int8",
-        description="Compute type for Whisper (int8, int16, float16, float32)",
+        description=(
+            "CTranslate2 compute type for Whisper "
+            "(int8, int8_float16, int16, float16, float32)"
+        ),
+    )
+    whisper_vad_filter: bool = Field(
+        default=True,
+        description="Skip non-speech audio with Silero VAD before decoding",
+    )
+    whisper_lazy_load: bool = Field(
+        default=False,
+        description="Defer loading the Whisper model until the first transcription",
     )
     max_concurrent_transcriptions: int = Field(
         default=2,
@@ -84,6 +99,22 @@ class Settings(BaseSettings):
         le=900,
     )
 
+    # Transcription cache
+    transcription_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse Whisper results for identical audio content",
+    )
+    transcription_cache_dir: Path = Field(
+        default=Path("/tmp/voice-notes/transcription-cache"),
+        description="Directory for cached transcription results",
+    )
+    transcription_cache_ttl_hours: int = Field(
+        default=24,
+        description="Hours to keep cached transcription results",
+        ge=1,
+        le=168,
+    )
+
     # Ollama Configuration
     ollama_base_url: str = Field(
         default="http://ollama:11434", description="Ollama service base URL"
@@ -183,6 +214,16 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level. Must be one of: {valid_levels}")
         return v_upper
 
+    @field_validator("whisper_compute_type")
+    @classmethod
+    def validate_whisper_compute_type(cls, v: str) -> str:
+        """Validate Whisper compute type."""
+        valid_types = {"int8", "int8_float16", "int16", "float16", "float32"}
+        v_lower = v.lower()
+        if v_lower not in valid_types:
+            raise ValueError(f"Invalid compute type. Must be one of: {valid_types}")
+        return v_lower
+
     @field_validator("obsidian_vault_path")
     @classmethod
     def validate_vault_path(cls, v: Path) -> Path:
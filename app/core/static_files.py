@@ -0,0 +1,181 @@
+"""Static file serving with cache headers and precompressed variants."""
+
+import base64
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import anyio
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Follows the nginx /static/ policy for deployments that serve from the app;
+# JSON (the manifest) gets the week nginx gives /manifest.json.
+IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_CONTROL = {
+    ".png": IMMUTABLE,
+    ".svg": IMMUTABLE,
+    ".json": "public, max-age=604800",
+    ".js": "public, max-age=31536000",
+    ".css": "public, max-age=31536000",
+}
+# The service worker must be revalidated or clients never pick up a new one
+NO_CACHE_FILES = {"service-worker.js", "sw.js"}
+
+# Scripts and stylesheets get a content-hash URL and an integrity attribute
+ASSET_PURPOSES = {".js": "script", ".css": "style"}
+ASSET_REF_RE = re.compile(r'(src|href)="(/static/[^"?]+\.(?:js|css))"')
+
+# Precompressed siblings written by scripts/precompress_static.py, best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(headers: Headers) -> List[str]:
+    """Return the content codings the client accepts (q > 0)."""
+    accepted = []
+    for part in headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        coding = coding.strip().lower()
+        if coding:
+            accepted.append(coding)
+    return accepted
+
+
+def cache_control_for(path: str, versioned: bool = False) -> str:
+    """Return the Cache-Control value for a static path."""
+    if os.path.basename(path) in NO_CACHE_FILES:
+        return "no-cache"
+    # A ?v=<hash> URL changes whenever the file does
+    if versioned:
+        return IMMUTABLE
+    return CACHE_CONTROL.get(os.path.splitext(path)[1].lower(), "no-cache")
+
+
+def build_asset_manifest(
+    directory: Path, url_prefix: str = "/static"
+) -> Dict[str, Dict[str, str]]:
+    """Map each script/stylesheet URL to its hashed URL, digest and purpose."""
+    manifest = {}
+    for path in sorted(directory.rglob("*")):
+        purpose = ASSET_PURPOSES.get(path.suffix)
+        if purpose is None or not path.is_file():
+            continue
+
+        digest = hashlib.sha256(path.read_bytes())
+        url = f"{url_prefix}/{path.relative_to(directory).as_posix()}"
+        manifest[url] = {
+            "url": f"{url}?v={digest.hexdigest()[:12]}",
+            "sha256": digest.hexdigest(),
+            "integrity": "sha256-" + base64.b64encode(digest.digest()).decode(),
+            "purpose": purpose,
+        }
+    return manifest
+
+
+def render_index(html: str, manifest: Dict[str, Dict[str, str]]) -> str:
+    """Point script/stylesheet references at hashed URLs with integrity."""
+
+    def replace(match: "re.Match[str]") -> str:
+        entry = manifest.get(match.group(2))
+        if entry is None:
+            return match.group(0)
+        return f'{match.group(1)}="{entry["url"]}" integrity="{entry["integrity"]}"'
+
+    return ASSET_REF_RE.sub(replace, html)
+
+
+class PreloadedAsset:
+    """A small, per-deploy constant static file held in memory."""
+
+    def __init__(self, path: Path):
+        """Read the file once and precompute its gzip body and ETag."""
+        self.body = path.read_bytes()
+        self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:16]}"'
+        self.cache_control = cache_control_for(path.name)
+
+    def response(self, headers: Headers, media_type: str) -> Response:
+        """Build a 200 or 304 response for a request without touching disk."""
+        response_headers = {
+            "ETag": self.etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = headers.get("if-none-match", "")
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if self.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=response_headers)
+
+        if "gzip" in accepted_encodings(headers):
+            response_headers["Content-Encoding"] = "gzip"
+            return Response(
+                self.gzip_body, media_type=media_type, headers=response_headers
+            )
+
+        return Response(self.body, media_type=media_type, headers=response_headers)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds Cache-Control and serves .br/.gz when present."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a precompressed variant if one exists, else the file itself."""
+        response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        versioned = "v" in QueryParams(scope["query_string"])
+        response.headers["Cache-Control"] = cache_control_for(path, versioned)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _precompressed_response(
+        self, path: str, scope: Scope
+    ) -> Optional[Response]:
+        """Return a response for the best accepted .br/.gz sibling, or None."""
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+
+        accepted = accepted_encodings(Headers(scope=scope))
+        if not accepted:
+            return None
+
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, path + suffix
+                )
+            except OSError:
+                continue
+
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            response = self.file_response(full_path, stat_result, scope)
+            if response.status_code == 200:
+                media_type = mimetypes.guess_type(path)[0] or "text/plain"
+                if media_type.startswith("text/"):
+                    media_type += "; charset=utf-8"
+                response.headers["Content-Type"] = media_type
+                response.headers["Content-Encoding"] = encoding
+            return response
+
+        return None
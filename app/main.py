@@ -2,13 +2,13 @@
 
 import logging
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app import __version__
@@ -27,6 +27,12 @@ from app.core.middleware import (
     RequestIDMiddleware,
 )
 from app.core.settings import settings
+from app.core.static_files import (
+    CachedStaticFiles,
+    PreloadedAsset,
+    build_asset_manifest,
+    render_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +79,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Failed to initialize Ollama service: {e}")
 
+    # Load the Whisper model once so it stays resident for every request
+    if not settings.whisper_lazy_load:
+        try:
+            from app.services.whisper_model import whisper_manager
+
+            logger.info("Preloading Whisper model")
+            await whisper_manager.ensure_loaded()
+        except Exception as e:
+            logger.error(f"Failed to preload Whisper model: {e}")
+
+    # Prove the vault is writable once; saves then only check permissions
+    try:
+        from app.services.vault import vault_service
+
+        await vault_service.probe_writable()
+        logger.info("Vault write check passed")
+    except Exception as e:
+        logger.error(f"Vault write check failed: {e}")
+
     # Start session cleanup task
     try:
         from app.tasks.cleanup import start_cleanup_task
@@ -87,6 +112,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Dialtone API")
 
+    from app.tasks.cleanup import stop_cleanup_task
+
+    await stop_cleanup_task()
+
+    # Release the vault directory fd
+    try:
+        from app.services.vault import vault_service
+
+        vault_service.close()
+    except Exception as e:
+        logger.warning(f"Error closing vault service: {e}")
+
     # Clean up Ollama service
     if settings.ollama_enabled:
         try:
@@ -158,8 +195,32 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    static_dir = Path("app/static")
+
+    # The manifest is constant per deploy, so serve it from memory. Both
+    # routes are registered before the mount so they take precedence over it.
+    manifest = PreloadedAsset(static_dir / "manifest.json")
+
+    @app.api_route("/manifest.json", methods=["GET", "HEAD"], include_in_schema=False)
+    async def get_manifest(request: Request):
+        """Serve PWA manifest with correct MIME type."""
+        return manifest.response(request.headers, "application/manifest+json")
+
+    @app.api_route(
+        "/static/manifest.json", methods=["GET", "HEAD"], include_in_schema=False
+    )
+    async def get_static_manifest(request: Request):
+        """Serve the PWA manifest at its static path."""
+        return manifest.response(request.headers, "application/json")
+
     # Mount static files for the web interface
-    app.mount("/static", StaticFiles(directory="app/static"), name="static")
+    app.mount("/static", CachedStaticFiles(directory=static_dir), name="static")
+
+    # Hash scripts/stylesheets once so the page can reference them by content
+    asset_manifest = build_asset_manifest(static_dir)
+    index_html = render_index(
+        (static_dir / "index.html").read_text(encoding="utf-8"), asset_manifest
+    )
 
     # Add custom middleware (order matters - rate limiting first)
     app.add_middleware(RequestIDMiddleware)
@@ -182,7 +243,7 @@ def create_app() -> FastAPI:
     # Root endpoint - serve the recording interface
     @app.get(
         "/",
-        response_class=FileResponse,
+        response_class=HTMLResponse,
         summary="Recording Interface",
         description="Serve the HTML recording interface for voice notes",
         response_description="HTML recording interface",
@@ -201,15 +262,8 @@ def create_app() -> FastAPI:
         This is a mobile-optimized Progressive Web App interface that allows users
         to record audio and upload it for transcription and processing.
         """
-        return FileResponse("app/static/index.html")
-
-    # PWA manifest endpoint with correct MIME type
-    @app.get("/manifest.json", include_in_schema=False)
-    async def get_manifest():
-        """Serve PWA manifest with correct MIME type."""
-        return FileResponse(
-            "app/static/manifest.json", media_type="application/manifest+json"
-        )
+        # no-cache so a deploy's new asset hashes are picked up on next load
+        return HTMLResponse(index_html, headers={"Cache-Control": "no-cache"})
 
     # API info endpoint for programmatic access
     @app.get(
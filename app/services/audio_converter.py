@@ -1,10 +1,13 @@
 """Audio converter service for format conversion using ffmpeg."""
 
+import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Tuple
 
 import ffmpeg
+import numpy as np
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,88 @@ class AudioConverter:
         self.target_sample_rate = 16000  # Optimal for Whisper
         self.target_channels = 1  # Mono
         self.target_format = "wav"  # Whisper-compatible format
+        # One ffmpeg process per core; bursts of uploads queue for a slot
+        # instead of oversubscribing the CPU with decoders
+        self.max_processes = os.cpu_count() or 1
+        self._process_slots = asyncio.Semaphore(self.max_processes)
+
+    async def decode_to_ndarray(self, input_path: Path) -> np.ndarray:
+        """Decode audio straight into Whisper's input format.
+
+        ffmpeg resamples to 16kHz mono float32 PCM and writes it to stdout,
+        so no intermediate WAV file is written and Whisper does not decode
+        the audio a second time.
+
+        Args:
+            input_path: Path to input audio file
+
+        Returns:
+            1-D float32 array of samples at target_sample_rate
+        """
+        cmd = [
+            "ffmpeg",
+            "-nostdin",
+            "-threads",
+            "0",
+            "-i",
+            str(input_path),
+            "-f",
+            "f32le",
+            "-ac",
+            str(self.target_channels),
+            "-ar",
+            str(self.target_sample_rate),
+            "-",
+        ]
+
+        try:
+            async with self._process_slots:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    stdout, stderr = await process.communicate()
+                except asyncio.CancelledError:
+                    # Nobody will read the pipe any more; don't leave ffmpeg
+                    # running, or blocked on a full stdout
+                    if process.returncode is None:
+                        process.kill()
+                    await process.wait()
+                    raise
+        except Exception as e:
+            logger.error(
+                "Audio decoding error",
+                extra={"input_path": str(input_path), "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "error": "Audio processing failed",
+                    "error_code": "PROCESSING_ERROR",
+                },
+            ) from e
+
+        if process.returncode != 0 or not stdout:
+            error_msg = (
+                f"FFmpeg decoding failed: {stderr.decode(errors='replace').strip()}"
+            )
+            logger.error(
+                "Audio decoding failed",
+                extra={"input_path": str(input_path), "error": error_msg},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "Audio conversion failed",
+                    "error_code": "CONVERSION_ERROR",
+                    "details": error_msg,
+                },
+            )
+
+        return np.frombuffer(stdout, dtype=np.float32)
 
     async def convert_to_whisper_format(
         self, input_path: Path, output_dir: Path
@@ -1,21 +1,49 @@
 """Transcription orchestration service."""
 
 import asyncio
+import json
 import logging
+import os
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set, Tuple
 
+import numpy as np
 from fastapi import HTTPException, status
 
 from app.core.settings import settings
 from app.services.audio_converter import audio_converter
 from app.services.ollama import ollama_service
+from app.services.transcription_cache import transcription_cache
+from app.services.upload import UPLOAD_META_FILENAME
 from app.services.whisper_model import whisper_manager
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ActiveJob:
+    """Lightweight handle for a running Whisper job.
+
+    Only the completion future and a cancel hook are kept, not the task
+    itself, so status lookups never hold on to a task's frames and results.
+    """
+
+    future: asyncio.Future
+    started: float
+    cancel: Callable[[], bool]
+
+
+@dataclass
+class SharedRun:
+    """A Whisper run shared by every concurrent request for the same audio."""
+
+    task: asyncio.Task
+    waiters: Set[asyncio.Future] = field(default_factory=set)
+
+
 class TranscriptionService:
     """Service for orchestrating complete transcription workflow."""
 
@@ -23,8 +51,44 @@ class TranscriptionService:
         """Initialize transcription service."""
         self.max_concurrent = settings.max_concurrent_transcriptions
         self.timeout_seconds = settings.transcription_timeout
-        self._semaphore = asyncio.Semaphore(self.max_concurrent)
-        self._active_transcriptions: Dict[str, asyncio.Task] = {}
+        self._active_count = 0
+        # Whisper runs in flight, keyed by audio content hash (or file path
+        # when the cache is off)
+        self._inflight: Dict[str, SharedRun] = {}
+        self._admission = asyncio.Condition()
+        self._active_transcriptions: Dict[str, ActiveJob] = {}
+
+    @asynccontextmanager
+    async def _admission_slot(self) -> AsyncIterator[None]:
+        """Hold one of the max_concurrent transcription slots."""
+        async with self._admission:
+            await self._admission.wait_for(
+                lambda: self._active_count < self.max_concurrent
+            )
+            self._active_count += 1
+        try:
+            yield
+        finally:
+            async with self._admission:
+                self._active_count -= 1
+                # Wake every waiter rather than one: a woken waiter that is
+                # cancelled before it runs would otherwise swallow the wakeup
+                self._admission.notify_all()
+
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Change the concurrency limit at runtime."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        async with self._admission:
+            self.max_concurrent = max_concurrent
+            # Wake every waiter; those that fit under the new limit proceed
+            self._admission.notify_all()
+
+        logger.info(
+            "Transcription concurrency limit updated",
+            extra={"max_concurrent": max_concurrent},
+        )
 
     async def transcribe_upload(
         self,
@@ -36,27 +100,32 @@ class TranscriptionService:
         """Transcribe uploaded audio file by upload_id."""
         # Get upload directory
         upload_dir = settings.upload_dir / upload_id
-        if not upload_dir.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": f"Upload {upload_id} not found",
-                    "error_code": "UPLOAD_NOT_FOUND",
-                },
-            )
 
-        # Find audio file in upload directory
-        audio_files = list(upload_dir.glob("*"))
-        if not audio_files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": f"No audio file found for upload {upload_id}",
-                    "error_code": "AUDIO_FILE_NOT_FOUND",
-                },
-            )
+        # The stored filename is recorded at upload time; only scan the
+        # directory for uploads without (or with unreadable) metadata.
+        # Filesystem lookups run in a thread so slow storage cannot stall
+        # the event loop.
+        audio_file = await asyncio.to_thread(self._read_upload_meta, upload_dir)
 
-        audio_file = audio_files[0]  # Should only be one file per upload
+        if audio_file is None:
+            if not await asyncio.to_thread(upload_dir.exists):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "error": f"Upload {upload_id} not found",
+                        "error_code": "UPLOAD_NOT_FOUND",
+                    },
+                )
+
+            audio_file = await asyncio.to_thread(self._scan_upload_dir, upload_dir)
+            if audio_file is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "error": f"No audio file found for upload {upload_id}",
+                        "error_code": "AUDIO_FILE_NOT_FOUND",
+                    },
+                )
 
         logger.info(
             "Starting transcription for upload",
@@ -67,6 +136,27 @@ class TranscriptionService:
             audio_file, upload_id, language, include_summary, max_summary_words
         )
 
+    @staticmethod
+    def _read_upload_meta(upload_dir: Path) -> Optional[Path]:
+        """Return the audio file named in the upload's metadata, if usable."""
+        try:
+            meta = json.loads((upload_dir / UPLOAD_META_FILENAME).read_text())
+            # Only trust a bare filename inside this upload's directory
+            audio_file = upload_dir / Path(meta["filename"]).name
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return audio_file if audio_file.is_file() else None
+
+    @staticmethod
+    def _scan_upload_dir(upload_dir: Path) -> Optional[Path]:
+        """Find the audio file in an upload directory (one per upload)."""
+        with os.scandir(upload_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    return Path(entry.path)
+        return None
+
     async def transcribe_file(
         self,
         audio_file: Path,
@@ -76,102 +166,44 @@ class TranscriptionService:
         max_summary_words: int = 150,
     ) -> Dict[str, Any]:
         """Transcribe a specific audio file."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        async with self._semaphore:
+        async with self._admission_slot():
             try:
-                # Ensure Whisper model is loaded
-                if not whisper_manager.is_loaded:
-                    if whisper_manager.is_loading:
-                        # Wait for model to finish loading
-                        while whisper_manager.is_loading:
-                            await asyncio.sleep(0.1)
-
-                    if not whisper_manager.is_loaded:
-                        await whisper_manager.load_model()
-
-                # Get audio file info
-                audio_info = await audio_converter.get_audio_info(audio_file)
-
-                logger.info(
-                    "Audio file info",
-                    extra={
-                        "upload_id": upload_id,
-                        "duration": audio_info["duration"],
-                        "format": audio_info["format"],
-                        "sample_rate": audio_info["sample_rate"],
-                        "channels": audio_info["channels"],
-                    },
-                )
-
-                # Convert audio if needed
-                processed_audio_path = audio_file
-                conversion_needed = audio_converter.is_conversion_needed(audio_file)
-
-                if conversion_needed:
-                    logger.info(
-                        "Converting audio for Whisper compatibility",
-                        extra={
-                            "upload_id": upload_id,
-                            "original_format": audio_info["format"],
-                        },
+                # Identical audio shares a content-hash key: reuse a cached
+                # result, or join a Whisper run already in flight for it.
+                # Without the cache, skip hashing and only coalesce repeat
+                # requests for the same file.
+                cached = None
+                if transcription_cache.enabled:
+                    cache_key = await transcription_cache.make_key(
+                        audio_file,
+                        language,
+                        settings.whisper_model_size,
+                        settings.whisper_compute_type,
+                        settings.whisper_vad_filter,
                     )
+                    cached = await transcription_cache.get(cache_key)
+                else:
+                    cache_key = f"file:{audio_file}\0{language or ''}"
 
-                    (
-                        processed_audio_path,
-                        duration,
-                    ) = await audio_converter.convert_to_whisper_format(
-                        audio_file, audio_file.parent
+                if cached is not None:
+                    logger.info(
+                        "Transcription cache hit",
+                        extra={"upload_id": upload_id, "cache_key": cache_key},
                     )
+                    result, duration = cached["result"], cached["duration"]
                 else:
-                    duration = audio_info["duration"]
-
-                # Perform transcription with timeout
-                try:
-                    transcription_task = asyncio.create_task(
-                        whisper_manager.transcribe(
-                            str(processed_audio_path),
-                            language=language,
-                        )
+                    result, duration = await self._run_whisper_shared(
+                        cache_key, audio_file, upload_id, language
                     )
 
-                    self._active_transcriptions[upload_id] = transcription_task
-
-                    result = await asyncio.wait_for(
-                        transcription_task, timeout=self.timeout_seconds
-                    )
-
-                finally:
-                    # Clean up task tracking
-                    self._active_transcriptions.pop(upload_id, None)
-
-                    # Clean up converted file if we created one
-                    if conversion_needed and processed_audio_path != audio_file:
-                        try:
-                            processed_audio_path.unlink()
-                            logger.info(
-                                "Cleaned up converted audio file",
-                                extra={
-                                    "upload_id": upload_id,
-                                    "file": str(processed_audio_path),
-                                },
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                "Failed to clean up converted file",
-                                extra={
-                                    "upload_id": upload_id,
-                                    "file": str(processed_audio_path),
-                                    "error": str(e),
-                                },
-                            )
-
                 # Generate summary if requested
                 summary = None
                 summary_processing_time = None
 
                 if include_summary:
-                    summary_start_time = time.time()
+                    summary_start_time = time.perf_counter()
                     transcription_text = result.get("text", "").strip()
 
                     if transcription_text:
@@ -190,18 +222,20 @@ class TranscriptionService:
                                     transcription_text, max_summary_words
                                 )
                                 summary_processing_time = round(
-                                    time.time() - summary_start_time, 2
-                                )
-                                logger.info(
-                                    "Summary generated successfully",
-                                    extra={
-                                        "upload_id": upload_id,
-                                        "summary_length": (
-                                            len(summary) if summary else 0
-                                        ),
-                                        "summary_time": summary_processing_time,
-                                    },
+                                    time.perf_counter() - summary_start_time, 2
                                 )
+                                # Skip the extra payload when INFO logging is off
+                                if logger.isEnabledFor(logging.INFO):
+                                    logger.info(
+                                        "Summary generated successfully",
+                                        extra={
+                                            "upload_id": upload_id,
+                                            "summary_length": (
+                                                len(summary) if summary else 0
+                                            ),
+                                            "summary_time": summary_processing_time,
+                                        },
+                                    )
                             else:
                                 logger.warning(
                                     "Ollama service unavailable, skipping summary generation",
@@ -228,7 +262,7 @@ class TranscriptionService:
                 keyword_processing_time = None
 
                 if settings.keyword_extraction_enabled:
-                    keyword_start_time = time.time()
+                    keyword_start_time = time.perf_counter()
                     transcription_text = result.get("text", "").strip()
 
                     if transcription_text:
@@ -247,21 +281,22 @@ class TranscriptionService:
                                     transcription_text, settings.keyword_max_count
                                 )
                                 keyword_processing_time = round(
-                                    time.time() - keyword_start_time, 2
-                                )
-                                logger.info(
-                                    "Keywords extracted successfully",
-                                    extra={
-                                        "upload_id": upload_id,
-                                        "keyword_count": (
-                                            len(keywords) if keywords else 0
-                                        ),
-                                        "keyword_time": keyword_processing_time,
-                                        "keywords": (
-                                            keywords[:3] if keywords else []
-                                        ),  # Log first 3 for debugging
-                                    },
+                                    time.perf_counter() - keyword_start_time, 2
                                 )
+                                if logger.isEnabledFor(logging.INFO):
+                                    logger.info(
+                                        "Keywords extracted successfully",
+                                        extra={
+                                            "upload_id": upload_id,
+                                            "keyword_count": (
+                                                len(keywords) if keywords else 0
+                                            ),
+                                            "keyword_time": keyword_processing_time,
+                                            "keywords": (
+                                                keywords[:3] if keywords else []
+                                            ),  # Log first 3 for debugging
+                                        },
+                                    )
                             else:
                                 logger.warning(
                                     "Ollama service unavailable, skipping keyword extraction",
@@ -284,7 +319,7 @@ class TranscriptionService:
                         )
                         keywords = []
 
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
 
                 # Format response
                 response: Dict[str, Any] = {
@@ -309,24 +344,25 @@ class TranscriptionService:
                     response["keywords"] = keywords
                     response["keyword_processing_time"] = keyword_processing_time
 
-                logger.info(
-                    "Transcription completed successfully",
-                    extra={
-                        "upload_id": upload_id,
-                        "processing_time": processing_time,
-                        "text_length": len(response["transcription"]["text"]),
-                        "language": response["transcription"]["language"],
-                        "summary_generated": summary is not None,
-                        "summary_time": summary_processing_time,
-                        "keywords_extracted": (
-                            keywords is not None and len(keywords) > 0
-                            if keywords
-                            else False
-                        ),
-                        "keyword_count": len(keywords) if keywords else 0,
-                        "keyword_time": keyword_processing_time,
-                    },
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Transcription completed successfully",
+                        extra={
+                            "upload_id": upload_id,
+                            "processing_time": processing_time,
+                            "text_length": len(response["transcription"]["text"]),
+                            "language": response["transcription"]["language"],
+                            "summary_generated": summary is not None,
+                            "summary_time": summary_processing_time,
+                            "keywords_extracted": (
+                                keywords is not None and len(keywords) > 0
+                                if keywords
+                                else False
+                            ),
+                            "keyword_count": len(keywords) if keywords else 0,
+                            "keyword_time": keyword_processing_time,
+                        },
+                    )
 
                 return response
 
@@ -366,6 +402,129 @@ class TranscriptionService:
                     },
                 ) from e
 
+    async def _run_whisper_shared(
+        self, key: str, audio_file: Path, upload_id: str, language: Optional[str]
+    ) -> Tuple[Dict[str, Any], float]:
+        """Run Whisper for key, coalescing concurrent requests for the same audio.
+
+        Every caller, including those that join a run already in flight, is
+        tracked as its own job. Cancelling one only detaches that caller; the
+        shared run is cancelled once no callers are left waiting on it. A
+        caller that goes away any other way leaves the run going so it still
+        fills the cache.
+        """
+        run = self._inflight.get(key)
+        if run is None:
+            run = SharedRun(
+                task=asyncio.create_task(
+                    self._run_whisper_and_cache(key, audio_file, upload_id, language)
+                )
+            )
+            self._inflight[key] = run
+            run.task.add_done_callback(lambda _: self._forget_run(key, run))
+        else:
+            logger.info(
+                "Joining in-flight transcription",
+                extra={"upload_id": upload_id, "cache_key": key},
+            )
+
+        # Each caller awaits its own shielded view of the run, so it can be
+        # detached without disturbing the others
+        waiter: "asyncio.Future[Tuple[Dict[str, Any], float]]"
+        waiter = asyncio.ensure_future(asyncio.shield(run.task))
+        run.waiters.add(waiter)
+
+        def cancel() -> bool:
+            cancelled = waiter.cancel()
+            run.waiters.discard(waiter)
+            if not run.waiters and not run.task.done():
+                self._forget_run(key, run)
+                run.task.cancel()
+            return cancelled
+
+        self._active_transcriptions[upload_id] = ActiveJob(
+            future=waiter, started=time.perf_counter(), cancel=cancel
+        )
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                # The request itself was cancelled, not just this job
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "error": f"Transcription for upload {upload_id} was cancelled",
+                    "error_code": "TRANSCRIPTION_CANCELLED",
+                },
+            )
+        finally:
+            run.waiters.discard(waiter)
+            self._active_transcriptions.pop(upload_id, None)
+
+    def _forget_run(self, key: str, run: SharedRun) -> None:
+        """Stop routing new callers for key to run."""
+        if self._inflight.get(key) is run:
+            del self._inflight[key]
+
+    async def _run_whisper_and_cache(
+        self, key: str, audio_file: Path, upload_id: str, language: Optional[str]
+    ) -> Tuple[Dict[str, Any], float]:
+        """Run Whisper and store the result in the transcription cache."""
+        result, duration = await self._run_whisper(audio_file, upload_id, language)
+
+        if transcription_cache.enabled:
+            await transcription_cache.set(
+                key, {"result": self._cacheable_result(result), "duration": duration}
+            )
+
+        return result, duration
+
+    async def _run_whisper(
+        self, audio_file: Path, upload_id: str, language: Optional[str]
+    ) -> Tuple[Dict[str, Any], float]:
+        """Decode audio and run Whisper on it.
+
+        Returns:
+            Tuple of (whisper_result, duration_seconds)
+        """
+        # Ensure Whisper model is loaded
+        if not whisper_manager.is_loaded:
+            await whisper_manager.ensure_loaded()
+
+        # Decode once into Whisper's input format; the sample count gives the
+        # duration without a separate probe
+        audio = await audio_converter.decode_to_ndarray(audio_file)
+        duration = len(audio) / audio_converter.target_sample_rate
+
+        logger.info(
+            "Audio decoded for transcription",
+            extra={"upload_id": upload_id, "duration": duration},
+        )
+
+        # Perform transcription with timeout
+        result = await asyncio.wait_for(
+            whisper_manager.transcribe(audio, language=language),
+            timeout=self.timeout_seconds,
+        )
+
+        return result, duration
+
+    @staticmethod
+    def _cacheable_result(whisper_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the Whisper result fields the response is built from."""
+        return {
+            "text": whisper_result.get("text", ""),
+            "language": whisper_result.get("language", "unknown"),
+            "segments": [
+                {"avg_logprob": segment["avg_logprob"]}
+                for segment in whisper_result.get("segments", [])
+                if "avg_logprob" in segment
+            ],
+        }
+
     def _calculate_confidence(self, whisper_result: Dict[str, Any]) -> float:
         """Calculate overall confidence score from Whisper result."""
         # Whisper doesn't provide direct confidence scores
@@ -376,16 +535,16 @@ class TranscriptionService:
             return 0.5  # Default moderate confidence
 
         # Calculate average confidence from segments if available
-        confidences = []
-        for segment in segments:
-            # Some Whisper versions include avg_logprob
-            if "avg_logprob" in segment:
-                # Convert log probability to confidence (rough approximation)
-                conf = max(0.0, min(1.0, (segment["avg_logprob"] + 1.0)))
-                confidences.append(conf)
+        # (some Whisper versions include avg_logprob)
+        logprobs = np.fromiter(
+            (s["avg_logprob"] for s in segments if "avg_logprob" in s),
+            dtype=np.float64,
+        )
 
-        if confidences:
-            return float(round(sum(confidences) / len(confidences), 2))
+        if logprobs.size:
+            # Convert log probability to confidence (rough approximation)
+            confidences = np.clip(logprobs + 1.0, 0.0, 1.0)
+            return round(float(confidences.mean()), 2)
 
         # Fallback: estimate based on text characteristics
         text = whisper_result.get("text", "").strip()
@@ -403,12 +562,12 @@ class TranscriptionService:
 
     async def get_transcription_status(self, upload_id: str) -> Dict[str, Any]:
         """Get status of active transcription."""
-        if upload_id in self._active_transcriptions:
-            task = self._active_transcriptions[upload_id]
+        job = self._active_transcriptions.get(upload_id)
+        if job is not None:
             return {
                 "upload_id": upload_id,
-                "status": "processing" if not task.done() else "completed",
-                "is_done": task.done(),
+                "status": "processing" if not job.future.done() else "completed",
+                "is_done": job.future.done(),
             }
 
         return {
@@ -419,10 +578,10 @@ class TranscriptionService:
 
     async def cancel_transcription(self, upload_id: str) -> bool:
         """Cancel active transcription if running."""
-        if upload_id in self._active_transcriptions:
-            task = self._active_transcriptions[upload_id]
-            if not task.done():
-                task.cancel()
+        job = self._active_transcriptions.get(upload_id)
+        if job is not None:
+            if not job.future.done():
+                job.cancel()
                 logger.info(
                     "Transcription cancelled",
                     extra={"upload_id": upload_id},
@@ -436,7 +595,7 @@ class TranscriptionService:
             "max_concurrent": self.max_concurrent,
             "timeout_seconds": self.timeout_seconds,
             "active_transcriptions": len(self._active_transcriptions),
-            "available_slots": self._semaphore._value,
+            "available_slots": max(0, self.max_concurrent - self._active_count),
             "whisper_model": whisper_manager.get_model_info(),
         }
 
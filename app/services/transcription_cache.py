@@ -0,0 +1,154 @@
+"""Content-addressed cache for Whisper transcription results."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Feed hashlib 1MB blocks so OpenSSL's SHA-256 (SHA-NI where available)
+# stays compute-bound instead of paying per-call overhead
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_entry(path: Path, cutoff: float) -> Optional[Dict[str, Any]]:
+    """Return an entry's payload, or None if it is missing or expired.
+
+    Expired entries are deleted. Raises if the file is not a valid entry.
+    """
+    try:
+        with open(path, "rb") as f:
+            entry = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+    # Valid JSON can still be the wrong shape (old format, a list)
+    created_at = float(entry["created_at"])
+    payload: Dict[str, Any] = entry["payload"]
+    if not isinstance(payload, dict):
+        raise TypeError("payload is not an object")
+
+    if created_at < cutoff:
+        path.unlink(missing_ok=True)
+        return None
+    return payload
+
+
+def _write_entry(path: Path, data: str) -> None:
+    """Write a cache entry atomically so readers never see a partial one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_text(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _purge_entries(cache_dir: Path, cutoff: float) -> int:
+    """Delete entries last written before cutoff and return the count."""
+    if not cache_dir.exists():
+        return 0
+
+    removed = 0
+    for entry_path in cache_dir.glob("*.json"):
+        try:
+            if entry_path.stat().st_mtime < cutoff:
+                entry_path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _hash_file(path: Path, suffix: bytes) -> str:
+    """Stream a file, then suffix, through SHA-256 and return the hex digest."""
+    digest = hashlib.sha256()
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    with open(path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+
+    digest.update(suffix)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """File-based cache of Whisper results keyed by audio content hash."""
+
+    def __init__(self):
+        """Initialize transcription cache."""
+        self.enabled = settings.transcription_cache_enabled
+        self.cache_dir = settings.transcription_cache_dir
+        self.ttl_seconds = settings.transcription_cache_ttl_hours * 3600
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Get file path for cache entry."""
+        return Path(self.cache_dir / f"{key}.json")
+
+    async def make_key(
+        self,
+        audio_path: Path,
+        language: Optional[str],
+        model_size: str,
+        compute_type: str,
+        vad_filter: bool,
+    ) -> str:
+        """Build a cache key from the audio bytes and Whisper's output settings."""
+        suffix = (
+            f"\0{language or ''}\0{model_size}\0{compute_type}\0{int(vad_filter)}"
+        ).encode()
+        return await asyncio.to_thread(_hash_file, audio_path, suffix)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached payload for key, or None if missing or expired."""
+        entry_path = self._get_entry_path(key)
+
+        try:
+            payload = await asyncio.to_thread(
+                _read_entry, entry_path, time.time() - self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable transcription cache entry",
+                extra={"cache_key": key, "error": str(e)},
+            )
+            return None
+
+        return payload
+
+    async def set(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store payload under key. Failures are logged, never raised."""
+        entry_path = self._get_entry_path(key)
+
+        try:
+            await asyncio.to_thread(
+                _write_entry,
+                entry_path,
+                json.dumps({"created_at": int(time.time()), "payload": payload}),
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to write transcription cache entry",
+                extra={"cache_key": key, "error": str(e)},
+            )
+
+    async def purge_expired(self) -> int:
+        """Remove entries older than the TTL and return how many were removed."""
+        cutoff = time.time() - self.ttl_seconds
+        return await asyncio.to_thread(_purge_entries, self.cache_dir, cutoff)
+
+
+# Global cache instance
+transcription_cache = TranscriptionCache()
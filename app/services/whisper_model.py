@@ -1,11 +1,13 @@
 """Whisper model management service with singleton pattern."""
 
+import asyncio
 import logging
+import os
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-import whisper
-from whisper import Whisper
+import numpy as np
+from faster_whisper import WhisperModel, download_model
 
 from app.core.exceptions import ResourceExhaustedError, WhisperError
 from app.core.settings import settings
@@ -32,12 +34,24 @@ class WhisperModelManager:
         if hasattr(self, "_initialized"):
             return
 
-        self._model: Optional[Whisper] = None
+        self._model: Optional[WhisperModel] = None
         self._model_size = settings.whisper_model_size
         self._device = settings.whisper_device
         self._compute_type = settings.whisper_compute_type
+        self._vad_filter = settings.whisper_vad_filter
+        # Inference is CPU bound: run at most this many at once, each with
+        # an equal share of the cores, so bursts queue instead of thrashing
+        cpu_count = os.cpu_count() or 1
+        self._max_concurrent = max(
+            1, min(settings.max_concurrent_transcriptions, cpu_count)
+        )
+        self._cpu_threads = max(1, cpu_count // self._max_concurrent)
+        self._slots = asyncio.Semaphore(self._max_concurrent)
+        self._waiting = 0
         self._loading = False
         self._load_error: Optional[str] = None
+        # Serializes loads: callers arriving mid-load wait for it to finish
+        self._load_lock = asyncio.Lock()
         self._initialized = True
 
         logger.info(
@@ -64,38 +78,69 @@ class WhisperModelManager:
         """Get last loading error if any."""
         return self._load_error
 
-    async def load_model(self) -> None:
-        """Load Whisper model asynchronously."""
+    async def ensure_loaded(self) -> None:
+        """Load the model if needed, sharing a single load across callers.
+
+        Concurrent callers block on the lock until the first load finishes
+        instead of polling; if that load fails the next caller retries it.
+        """
         if self._model is not None:
             return
 
-        if self._loading:
-            logger.info("Model already loading, waiting...")
-            return
+        await self.load_model()
+
+    def _resolve_model_path(self) -> str:
+        """Prefer an already-downloaded model snapshot over a Hub lookup.
 
-        with self._lock:
-            if self._model is not None:
-                return
+        Loading by size name asks the Hugging Face Hub for the latest
+        revision on every start; a local snapshot path loads straight from
+        disk (and the OS page cache on warm restarts).
+        """
+        try:
+            model_path: str = download_model(self._model_size, local_files_only=True)
+            return model_path
+        except FileNotFoundError:
+            # Not cached yet - let WhisperModel download it
+            return self._model_size
+
+    async def load_model(self) -> None:
+        """Load Whisper model asynchronously, one load at a time."""
+        if self._model is not None:
+            return
 
-            if self._loading:
-                return
+        if self._load_lock.locked():
+            logger.info("Model already loading, waiting...")
 
-            self._loading = True
-            self._load_error = None
+        async with self._load_lock:
+            if self._model is None:
+                await self._load_locked()
 
+    async def _load_locked(self) -> None:
+        """Construct the model; the caller must hold ``_load_lock``."""
+        self._loading = True
+        self._load_error = None
         try:
             logger.info(
                 "Loading Whisper model",
                 extra={
                     "model_size": self._model_size,
                     "device": self._device,
+                    "compute_type": self._compute_type,
                 },
             )
 
-            # Load model - this is CPU intensive but runs in thread pool
-            self._model = whisper.load_model(
-                name=self._model_size,
+            # CTranslate2 quantizes weights at load time to compute_type
+            # (int8 by default), cutting memory and speeding up inference
+            # Model construction is CPU and disk bound - keep it off the loop
+            self._model = await asyncio.to_thread(
+                WhisperModel,
+                await asyncio.to_thread(self._resolve_model_path),
                 device=self._device,
+                compute_type=self._compute_type,
+                cpu_threads=self._cpu_threads,
+                # One model replica per slot so concurrent calls don't queue
+                # inside CTranslate2
+                num_workers=self._max_concurrent,
             )
 
             logger.info(
@@ -134,11 +179,18 @@ class WhisperModelManager:
 
     async def transcribe(
         self,
-        audio_path: str,
+        audio: Union[str, np.ndarray],
         language: Optional[str] = None,
         task: str = "transcribe",
     ) -> Dict[str, Any]:
-        """Transcribe audio file using loaded model."""
+        """Transcribe audio using loaded model.
+
+        Accepts either a file path or 16kHz mono float32 samples; passing
+        samples skips the backend's own audio decode.
+        """
+        # Describe the input for logs without dumping sample data
+        audio_path = audio if isinstance(audio, str) else f"<{len(audio)} samples>"
+
         if self._model is None:
             raise WhisperError(
                 "Whisper model not loaded",
@@ -156,14 +208,33 @@ class WhisperModelManager:
                 },
             )
 
-            # Transcribe audio
-            result = self._model.transcribe(
-                audio=audio_path,
-                language=language,
-                task=task,
-                fp16=False,  # Use fp32 for CPU compatibility
-                verbose=False,  # Reduce logging noise
+            if self._slots.locked():
+                logger.info(
+                    "Waiting for a free transcription slot",
+                    extra={
+                        "audio_path": audio_path,
+                        "queued": self._waiting + 1,
+                        "max_concurrent": self._max_concurrent,
+                    },
+                )
+
+            self._waiting += 1
+            try:
+                await self._slots.acquire()
+            finally:
+                self._waiting -= 1
+
+            # Inference runs in a worker thread so the event loop keeps serving
+            # other requests while CTranslate2 (which releases the GIL) decodes.
+            # The slot is freed when the thread finishes, not when this call
+            # returns, so a timed-out caller doesn't free a busy core.
+            inference = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self._transcribe_sync, self._model, audio, language, task
+                )
             )
+            inference.add_done_callback(self._release_slot)
+            result = await asyncio.shield(inference)
 
             logger.info(
                 "Transcription completed",
@@ -175,8 +246,7 @@ class WhisperModelManager:
                 },
             )
 
-            # Cast result to expected type for mypy
-            return dict(result)
+            return result
 
         except MemoryError as e:
             error_msg = f"Insufficient memory for transcription: {str(e)}"
@@ -205,12 +275,61 @@ class WhisperModelManager:
                 details={"audio_path": audio_path},
             ) from e
 
+    def _release_slot(self, inference: "asyncio.Future[Dict[str, Any]]") -> None:
+        """Free a transcription slot once its inference thread finishes."""
+        self._slots.release()
+        if not inference.cancelled():
+            # Mark the error retrieved if the caller stopped waiting for it
+            inference.exception()
+
+    def _transcribe_sync(
+        self,
+        model: WhisperModel,
+        audio: Union[str, np.ndarray],
+        language: Optional[str],
+        task: str,
+    ) -> Dict[str, Any]:
+        """Run the model and collect its segments (blocking)."""
+        # Segments are decoded lazily as the generator is consumed, so the
+        # result has to be built on this thread too; VAD drops silent
+        # stretches before they reach the decoder
+        segments, info = model.transcribe(
+            audio,
+            language=language,
+            task=task,
+            vad_filter=self._vad_filter,
+        )
+        return self._build_result(segments, info)
+
+    @staticmethod
+    def _build_result(segments: Iterable[Any], info: Any) -> Dict[str, Any]:
+        """Build the result dict shape returned by openai-whisper."""
+        segment_dicts: List[Dict[str, Any]] = [
+            {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob,
+            }
+            for segment in segments
+        ]
+
+        return {
+            "text": "".join(segment["text"] for segment in segment_dicts),
+            "language": info.language,
+            "duration": info.duration,
+            "segments": segment_dicts,
+        }
+
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model."""
         return {
             "model_size": self._model_size,
             "device": self._device,
             "compute_type": self._compute_type,
+            "max_concurrent": self._max_concurrent,
             "is_loaded": self.is_loaded,
             "is_loading": self.is_loading,
             "load_error": self.load_error,
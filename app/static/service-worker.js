@@ -173,15 +173,30 @@ async function handleAppShellRequest(request) {
   // Fallback to network
   try {
     const response = await fetch(request);
-    const cache = await caches.open(CACHE_NAME);
-    cache.put(request, response.clone());
+    if (response.ok) {
+      await putAppShellResponse(request, response.clone());
+    }
     return response;
   } catch (error) {
+    // Offline: scripts and stylesheets are requested as ?v=<hash>, so fall
+    // back to any cached version, including the copy precached at install
+    const fallbackResponse = await caches.match(request, { ignoreSearch: true });
+    if (fallbackResponse) {
+      return fallbackResponse;
+    }
     console.error('Failed to fetch app shell resource:', request.url);
     return createOfflineResponse(request.url);
   }
 }
 
+// Keep one entry per app shell file, so each deploy's ?v=<hash> URL
+// replaces the previous version instead of piling up next to it
+async function putAppShellResponse(request, response) {
+  const cache = await caches.open(CACHE_NAME);
+  await cache.delete(request, { ignoreSearch: true });
+  await cache.put(request, response);
+}
+
 // Generic network-first with cache fallback
 async function handleGenericRequest(request) {
   try {
@@ -200,8 +215,7 @@ async function updateCacheInBackground(request) {
   try {
     const response = await fetch(request);
     if (response.ok) {
-      const cache = await caches.open(CACHE_NAME);
-      cache.put(request, response);
+      await putAppShellResponse(request, response);
     }
   } catch (error) {
     console.log('Background cache update failed:', request.url);
@@ -2,16 +2,27 @@
 
 import asyncio
 import logging
+import time
+from typing import Optional
 
 from app.core.settings import settings
 from app.services.session_manager import session_manager
+from app.services.transcription_cache import transcription_cache
 
 logger = logging.getLogger(__name__)
 
+# Held so the running task can't be garbage collected mid-sleep
+_cleanup_task: Optional[asyncio.Task] = None
+
 
 async def cleanup_expired_sessions():
     """Background task to cleanup expired sessions."""
+    interval = settings.session_cleanup_interval_minutes * 60
+
     while True:
+        # Schedule from the start of the run so cleanup time doesn't add drift
+        next_run = time.monotonic() + interval
+
         try:
             cleanup_count = await session_manager.cleanup_expired_sessions()
 
@@ -21,13 +32,45 @@ async def cleanup_expired_sessions():
         except Exception as e:
             logger.error(f"Session cleanup task failed: {e}")
 
-        # Wait for next cleanup cycle
-        await asyncio.sleep(settings.session_cleanup_interval_minutes * 60)
+        try:
+            purged_count = await transcription_cache.purge_expired()
+
+            if purged_count > 0:
+                logger.info(
+                    f"Purged {purged_count} expired transcription cache entries"
+                )
+
+        except Exception as e:
+            logger.error(f"Transcription cache cleanup failed: {e}")
+
+        # Wait for next cleanup cycle; a run that overran starts the next at once
+        await asyncio.sleep(max(0.0, next_run - time.monotonic()))
+
 
+def start_cleanup_task() -> asyncio.Task:
+    """Start background cleanup task, unless it is already running."""
+    global _cleanup_task
 
-def start_cleanup_task():
-    """Start background cleanup task."""
-    asyncio.create_task(cleanup_expired_sessions())
+    if _cleanup_task is not None and not _cleanup_task.done():
+        return _cleanup_task
+
+    _cleanup_task = asyncio.create_task(cleanup_expired_sessions())
     logger.info(
         f"Session cleanup task started with {settings.session_cleanup_interval_minutes} minute intervals"
     )
+    return _cleanup_task
+
+
+async def stop_cleanup_task() -> None:
+    """Cancel the background cleanup task and wait for it to finish."""
+    global _cleanup_task
+
+    task, _cleanup_task = _cleanup_task, None
+    if task is None or task.done():
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -1,13 +1,30 @@
 #!/usr/bin/env python3
 """Generate PWA icons from base SVG."""
 
+import argparse
+import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    from PIL import Image, ImageDraw
+
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Resolve ImageMagick once rather than failing a fork per icon; None if absent
+CONVERT_BIN = shutil.which("convert")
+
 # Define icon sizes
 STANDARD_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
 MASKABLE_SIZES = [192, 512]
 SHORTCUT_SIZE = 96
+# Rasterize the SVG once at this size and downscale everything from it
+MASTER_SIZE = 1024
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -16,97 +33,203 @@ ICONS_DIR = PROJECT_ROOT / "app" / "static" / "assets" / "icons"
 BASE_SVG = ICONS_DIR / "icon-base.svg"
 
 
-def generate_standard_icons():
-    """Generate standard PWA icons."""
-    print("Generating standard icons...")
-    for size in STANDARD_SIZES:
-        output_file = ICONS_DIR / f"icon-{size}x{size}.png"
-        print(f"  Creating {output_file.name}...")
+def rasterize_base():
+    """Rasterize the base SVG once, or return None if Pillow/convert missing."""
+    if not (HAS_PIL and CONVERT_BIN):
+        return None
 
-        # Using ImageMagick convert or rsvg-convert if available
-        # Fallback to creating placeholder if tools not available
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        master_file = Path(tmp_dir) / "icon-master.png"
         try:
             subprocess.run(
                 [
-                    "convert",
+                    CONVERT_BIN,
                     "-background",
                     "none",
                     "-resize",
-                    f"{size}x{size}",
+                    f"{MASTER_SIZE}x{MASTER_SIZE}",
                     str(BASE_SVG),
-                    str(output_file),
+                    str(master_file),
                 ],
                 check=True,
                 capture_output=True,
             )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Create a simple placeholder PNG
-            create_placeholder_png(output_file, size, "#7c3aed")
+            with Image.open(master_file) as master:
+                return master.convert("RGBA")
+        except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+            return None
+
+
+def downscale(base, size):
+    """Resize the rasterized base to a square icon."""
+    return base.resize((size, size), Image.LANCZOS)
+
+
+def downscale_padded(base, size, background):
+    """Resize the base into the safe zone of a square background canvas."""
+    # Maskable icons need 20% padding for safe zone
+    padded_size = int(size * 0.8)
+    icon = downscale(base, padded_size)
+    canvas = Image.new("RGBA", (size, size), background)
+    offset = (size - padded_size) // 2
+    canvas.paste(icon, (offset, offset), icon)
+    return canvas
+
+
+def placeholder_marker(output_file):
+    """Return the sidecar file that marks output_file as a placeholder."""
+    return output_file.with_name(f"{output_file.name}.placeholder")
+
+
+def save_icon(image, output_file):
+    """Save a real rendering, clearing any placeholder marker."""
+    image.save(output_file, "PNG")
+    placeholder_marker(output_file).unlink(missing_ok=True)
+
+
+def render_icon(args, output_file, size, color, background="transparent"):
+    """Run one convert command, falling back to a placeholder on failure."""
+    try:
+        if not CONVERT_BIN:
+            raise FileNotFoundError("convert")
+        subprocess.run(args, check=True, capture_output=True)
+        placeholder_marker(output_file).unlink(missing_ok=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # Create a simple placeholder PNG
+        create_placeholder_png(output_file, size, color, background=background)
+    return output_file
 
 
-def generate_maskable_icons():
+def render_icons(jobs):
+    """Render (args, output_file, size, color, background) jobs in parallel."""
+    if not CONVERT_BIN:
+        # Nothing to fork; placeholders are drawn in-process
+        for job in jobs:
+            print(f"  Created {render_icon(*job).name}")
+        return
+
+    # Each job is its own convert process, so threads rasterize on every core
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(render_icon, *job) for job in jobs]
+        for future in as_completed(futures):
+            print(f"  Created {future.result().name}")
+
+
+def is_up_to_date(output_file):
+    """Check whether an icon exists, is non-empty and is newer than the SVG."""
+    try:
+        stat = output_file.stat()
+    except FileNotFoundError:
+        return False
+    # Placeholders only stand in until ImageMagick is available to render
+    if CONVERT_BIN and placeholder_marker(output_file).exists():
+        return False
+    # Empty files are the last-resort placeholder, so always retry those
+    return stat.st_size > 0 and stat.st_mtime >= BASE_SVG.stat().st_mtime
+
+
+def stale_sizes(sizes, name, force=False):
+    """Return the sizes whose icon (name formatted with size) needs rendering."""
+    return [
+        size
+        for size in sizes
+        if force or not is_up_to_date(ICONS_DIR / name.format(size=size))
+    ]
+
+
+def generate_standard_icons(base=None, sizes=STANDARD_SIZES):
+    """Generate standard PWA icons."""
+    print("Generating standard icons...")
+    if base is not None:
+        for size in sizes:
+            output_file = ICONS_DIR / f"icon-{size}x{size}.png"
+            print(f"  Creating {output_file.name}...")
+            save_icon(downscale(base, size), output_file)
+        return
+
+    jobs = []
+    for size in sizes:
+        output_file = ICONS_DIR / f"icon-{size}x{size}.png"
+
+        # Using ImageMagick convert or rsvg-convert if available
+        # Fallback to creating placeholder if tools not available
+        args = [
+            CONVERT_BIN,
+            "-background",
+            "none",
+            "-resize",
+            f"{size}x{size}",
+            str(BASE_SVG),
+            str(output_file),
+        ]
+        jobs.append((args, output_file, size, "#7c3aed", "transparent"))
+
+    render_icons(jobs)
+
+
+def generate_maskable_icons(base=None, sizes=MASKABLE_SIZES):
     """Generate maskable icons with safe zone padding."""
     print("Generating maskable icons...")
-    for size in MASKABLE_SIZES:
+    if base is not None:
+        for size in sizes:
+            output_file = ICONS_DIR / f"icon-{size}x{size}-maskable.png"
+            print(f"  Creating {output_file.name}...")
+            save_icon(downscale_padded(base, size, "#1a1a1a"), output_file)
+        return
+
+    jobs = []
+    for size in sizes:
         output_file = ICONS_DIR / f"icon-{size}x{size}-maskable.png"
-        print(f"  Creating {output_file.name}...")
 
         # Maskable icons need 20% padding for safe zone
         padded_size = int(size * 0.8)
-        try:
-            subprocess.run(
-                [
-                    "convert",
-                    "-background",
-                    "#1a1a1a",
-                    "-resize",
-                    f"{padded_size}x{padded_size}",
-                    "-gravity",
-                    "center",
-                    "-extent",
-                    f"{size}x{size}",
-                    str(BASE_SVG),
-                    str(output_file),
-                ],
-                check=True,
-                capture_output=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Create a simple placeholder PNG
-            create_placeholder_png(output_file, size, "#7c3aed", background="#1a1a1a")
+        args = [
+            CONVERT_BIN,
+            "-background",
+            "#1a1a1a",
+            "-resize",
+            f"{padded_size}x{padded_size}",
+            "-gravity",
+            "center",
+            "-extent",
+            f"{size}x{size}",
+            str(BASE_SVG),
+            str(output_file),
+        ]
+        jobs.append((args, output_file, size, "#7c3aed", "#1a1a1a"))
+
+    render_icons(jobs)
 
 
-def generate_shortcut_icon():
+def generate_shortcut_icon(base=None):
     """Generate shortcut icon."""
     print("Generating shortcut icon...")
     output_file = ICONS_DIR / f"shortcut-record.png"
     print(f"  Creating {output_file.name}...")
 
-    try:
-        subprocess.run(
-            [
-                "convert",
-                "-background",
-                "none",
-                "-resize",
-                f"{SHORTCUT_SIZE}x{SHORTCUT_SIZE}",
-                str(BASE_SVG),
-                str(output_file),
-            ],
-            check=True,
-            capture_output=True,
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Create a simple placeholder PNG
-        create_placeholder_png(output_file, SHORTCUT_SIZE, "#7c3aed")
+    if base is not None:
+        save_icon(downscale(base, SHORTCUT_SIZE), output_file)
+        return
+
+    args = [
+        CONVERT_BIN,
+        "-background",
+        "none",
+        "-resize",
+        f"{SHORTCUT_SIZE}x{SHORTCUT_SIZE}",
+        str(BASE_SVG),
+        str(output_file),
+    ]
+    render_icon(args, output_file, SHORTCUT_SIZE, "#7c3aed")
 
 
 def create_placeholder_png(output_file, size, color, background="transparent"):
     """Create a simple colored square as placeholder."""
-    # Using PIL if available, otherwise create using ImageMagick
-    try:
-        from PIL import Image, ImageDraw
+    # Recorded so a later run with ImageMagick replaces it
+    placeholder_marker(output_file).touch()
 
+    # Using PIL if available, otherwise create using ImageMagick
+    if HAS_PIL:
         # Create image with background
         if background == "transparent":
             img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
@@ -122,33 +245,44 @@ def create_placeholder_png(output_file, size, color, background="transparent"):
         draw.ellipse([margin, margin, size - margin, size - margin], fill=circle_color)
 
         img.save(output_file, "PNG")
-    except ImportError:
-        # Fallback to ImageMagick
-        try:
-            bg_opt = "none" if background == "transparent" else background
-            subprocess.run(
-                [
-                    "convert",
-                    "-size",
-                    f"{size}x{size}",
-                    f"xc:{bg_opt}",
-                    "-fill",
-                    color,
-                    "-draw",
-                    f"circle {size//2},{size//2} {size//2},{size//4}",
-                    str(output_file),
-                ],
-                check=True,
-                capture_output=True,
-            )
-        except:
-            # Last resort: create empty file
-            output_file.touch()
-            print(f"    Warning: Could not generate {output_file.name}")
+        return
+
+    # Fallback to ImageMagick
+    try:
+        if not CONVERT_BIN:
+            raise FileNotFoundError("convert")
+        bg_opt = "none" if background == "transparent" else background
+        subprocess.run(
+            [
+                CONVERT_BIN,
+                "-size",
+                f"{size}x{size}",
+                f"xc:{bg_opt}",
+                "-fill",
+                color,
+                "-draw",
+                f"circle {size//2},{size//2} {size//2},{size//4}",
+                str(output_file),
+            ],
+            check=True,
+            capture_output=True,
+        )
+    except:
+        # Last resort: create empty file
+        output_file.touch()
+        print(f"    Warning: Could not generate {output_file.name}")
 
 
-def main():
+def main(argv=None):
     """Generate all PWA icons."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate icons even if they are newer than the base SVG",
+    )
+    args = parser.parse_args(argv)
+
     print(f"Generating PWA icons in {ICONS_DIR}")
 
     # Ensure icons directory exists
@@ -159,10 +293,28 @@ def main():
         print(f"Error: Base SVG not found at {BASE_SVG}")
         return 1
 
-    # Generate icons
-    generate_standard_icons()
-    generate_maskable_icons()
-    generate_shortcut_icon()
+    # Only render icons that are missing or older than the SVG
+    standard_sizes = stale_sizes(STANDARD_SIZES, "icon-{size}x{size}.png", args.force)
+    maskable_sizes = stale_sizes(
+        MASKABLE_SIZES, "icon-{size}x{size}-maskable.png", args.force
+    )
+    shortcut_stale = bool(
+        stale_sizes([SHORTCUT_SIZE], "shortcut-record.png", args.force)
+    )
+
+    if standard_sizes or maskable_sizes or shortcut_stale:
+        # Render the SVG once; without Pillow each size runs its own convert
+        base = rasterize_base()
+
+        # Generate icons
+        if standard_sizes:
+            generate_standard_icons(base, standard_sizes)
+        if maskable_sizes:
+            generate_maskable_icons(base, maskable_sizes)
+        if shortcut_stale:
+            generate_shortcut_icon(base)
+    else:
+        print("All icons are up to date (use --force to regenerate)")
 
     print("\nIcon generation complete!")
     print(f"Icons saved to: {ICONS_DIR}")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Write .gz and .br siblings for compressible static assets."""
+
+import argparse
+import gzip
+from pathlib import Path
+
+try:
+    import brotli
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import zopfli.gzip
+
+    HAS_ZOPFLI = True
+except ImportError:
+    HAS_ZOPFLI = False
+
+# Only text assets shrink; PNGs are already deflate-compressed
+COMPRESSIBLE_SUFFIXES = {".js", ".css", ".json", ".svg", ".html"}
+# Below this the encoding overhead isn't worth an extra file
+MIN_SIZE = 256
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+STATIC_DIR = PROJECT_ROOT / "app" / "static"
+
+
+def gzip_bytes(data):
+    """Gzip data, using zopfli when it is installed."""
+    if HAS_ZOPFLI:
+        return zopfli.gzip.compress(data)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(data):
+    """Brotli-compress data at maximum quality."""
+    return brotli.compress(data, quality=11)
+
+
+def is_up_to_date(source, target):
+    """Return True if target exists and is newer than source."""
+    return target.exists() and target.stat().st_mtime >= source.stat().st_mtime
+
+
+def precompress(source, force=False):
+    """Write compressed siblings of source and return the paths written."""
+    data = source.read_bytes()
+    if len(data) < MIN_SIZE:
+        return []
+
+    encoders = [(".gz", gzip_bytes)]
+    if HAS_BROTLI:
+        encoders.append((".br", brotli_bytes))
+
+    written = []
+    for suffix, encode in encoders:
+        target = source.with_name(source.name + suffix)
+        if not force and is_up_to_date(source, target):
+            continue
+
+        compressed = encode(data)
+        # A variant that doesn't save bytes would only cost the client
+        if len(compressed) >= len(data):
+            target.unlink(missing_ok=True)
+            continue
+
+        target.write_bytes(compressed)
+        written.append(target)
+
+    return written
+
+
+def main(argv=None):
+    """Precompress all compressible files under app/static."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recompress files even if the variants are newer than the source",
+    )
+    args = parser.parse_args(argv)
+
+    print(f"Precompressing static assets in {STATIC_DIR}")
+    if not HAS_BROTLI:
+        print("Note: brotli not installed, writing gzip variants only")
+
+    sources = sorted(
+        path
+        for path in STATIC_DIR.rglob("*")
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES
+    )
+
+    count = 0
+    for source in sources:
+        for target in precompress(source, args.force):
+            print(f"✓ {target.relative_to(STATIC_DIR)}")
+            count += 1
+
+    print(f"Wrote {count} compressed files")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -106,9 +106,10 @@ echo ""
 # Build pytest command
 PYTEST_CMD="pytest"
 
-# Add parallel execution if requested
+# Add parallel execution if requested; loadfile keeps each test module on one
+# worker so module-scoped clients are built once per module
 if [ "$PARALLEL" = true ]; then
-    PYTEST_CMD="$PYTEST_CMD -n auto"
+    PYTEST_CMD="$PYTEST_CMD -n auto --dist=loadfile"
 fi
 
 # Add verbose output if requested
@@ -101,6 +101,7 @@ test_nginx_config() {
     run_test "Upstream backend configured" "grep -q 'upstream dialtone_backend' '$config_file'"
     run_test "Rate limiting configured" "grep -q 'limit_req_zone' '$config_file'"
     run_test "Gzip compression enabled" "grep -q 'gzip on' '$config_file'"
+    run_test "HTTP/2 enabled" "grep -q 'listen 443 ssl http2' '$config_file'"
 }
 
 # Test SSL certificate generation
@@ -198,6 +199,7 @@ test_runtime_connectivity() {
             run_test "HTTPS health check" "curl -k -f -s https://localhost/health > /dev/null"
             run_test "HTTP redirects to HTTPS" "curl -s -I http://localhost/ | grep -q '301'"
             run_test "Security headers present" "curl -k -s -I https://localhost/ | grep -i 'strict-transport-security'"
+            run_test "Static assets served over HTTP/2" "curl -k -s -o /dev/null --http2 -w '%{http_version}' https://localhost/static/assets/icons/icon-192x192.png | grep -q '^2'"
         else
             log_warn "curl not available for runtime connectivity tests"
         fi
@@ -1,63 +1,91 @@
 """Tests for audio upload API endpoints."""
 
-from io import BytesIO
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from app.main import app
+from app.services.transcription import transcription_service
+from app.services.upload import upload_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create test client."""
-    return TestClient(app)
+    """Create one test client for the whole run."""
+    # Not entered as a context manager: that would run the app lifespan and
+    # preload the Whisper model, which none of these mocked tests need
+    test_client = TestClient(app)
+    yield test_client
+    test_client.close()
 
 
 @pytest.fixture
 def valid_audio_file():
     """Create valid audio file for testing."""
-    content = b"fake webm audio data"
-    return ("test_audio.webm", BytesIO(content), "audio/webm")
+    return ("test_audio.webm", b"fake webm audio data", "audio/webm")
+
+
+@pytest.fixture(scope="module")
+def openapi_spec(client):
+    """Fetch and parse the OpenAPI schema once for the module."""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
+
+
+# What a successful process_upload returns; read-only so mocks can share it
+UPLOAD_RESULT = MappingProxyType(
+    {
+        "upload_id": "test-id",
+        "filename": "test.webm",
+        "file_size": 19,
+        "mime_type": "audio/webm",
+        "status": "uploaded",
+        "created_at": "2025-07-28T12:00:00Z",
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def upload_result(**overrides):
+    """Build an upload result differing from UPLOAD_RESULT only in overrides."""
+    return MappingProxyType({**UPLOAD_RESULT, **overrides})
+
+
+@pytest.fixture
+def mock_upload():
+    """Patch process_upload to succeed without touching the filesystem."""
+    with patch.object(upload_service, "process_upload") as mock:
+        mock.return_value = UPLOAD_RESULT
+        yield mock
 
 
 @pytest.fixture
-def large_audio_file():
-    """Create large audio file for testing."""
-    # Create content larger than 50MB
-    content = b"x" * (55 * 1024 * 1024)  # 55MB
-    return ("large_audio.webm", BytesIO(content), "audio/webm")
+def mock_transcribe():
+    """Patch transcribe_upload; tests set its return value or side effect."""
+    with patch.object(transcription_service, "transcribe_upload") as mock:
+        yield mock
 
 
 @pytest.fixture
 def invalid_format_file():
     """Create invalid format file for testing."""
-    content = b"not audio data"
-    return ("document.txt", BytesIO(content), "text/plain")
+    return ("document.txt", b"not audio data", "text/plain")
 
 
 class TestAudioUploadEndpoint:
     """Test audio upload endpoint."""
 
-    def test_upload_endpoint_exists(self, client):
-        """Test that upload endpoint exists and accepts POST."""
-        # Test without file should return 422 (validation error)
-        response = client.post("/api/v1/audio/upload")
-        assert response.status_code == 422  # Missing required file
-
-    @patch("app.services.upload.upload_service.process_upload")
-    def test_upload_success(self, mock_process_upload, client, valid_audio_file):
+    def test_upload_success(self, mock_upload, client, valid_audio_file):
         """Test successful file upload."""
-        # Mock successful upload
-        mock_process_upload.return_value = {
-            "upload_id": "test-123-456",
-            "filename": "20250728_test-123-456.webm",
-            "file_size": 19,
-            "mime_type": "audio/webm",
-            "status": "uploaded",
-            "created_at": "2025-07-28T12:00:00Z",
-        }
+        mock_upload.return_value = upload_result(
+            upload_id="test-123-456", filename="20250728_test-123-456.webm"
+        )
 
         response = client.post("/api/v1/audio/upload", files={"file": valid_audio_file})
 
@@ -73,6 +101,7 @@ class TestAudioUploadEndpoint:
 
     def test_upload_missing_file(self, client):
         """Test upload without file."""
+        # A 422 rather than 404/405 also shows the endpoint exists and takes POST
         response = client.post("/api/v1/audio/upload")
 
         assert response.status_code == 422
@@ -83,7 +112,7 @@ class TestAudioUploadEndpoint:
     def test_upload_empty_file(self, client):
         """Test upload with empty filename."""
         # FastAPI validation will reject empty filename as 422
-        empty_file = ("", BytesIO(b"test"), "audio/webm")
+        empty_file = ("", b"test", "audio/webm")
 
         response = client.post("/api/v1/audio/upload", files={"file": empty_file})
 
@@ -103,11 +132,9 @@ class TestAudioUploadEndpoint:
     def test_upload_file_too_large(self, client):
         """Test upload with file too large."""
         # Create content larger than 50MB limit
-        with patch(
-            "app.services.upload.upload_service.max_size", 1024
-        ):  # 1KB limit for test
+        with patch.object(upload_service, "max_size", 1024):  # 1KB limit for test
             large_content = b"x" * 2048  # 2KB, larger than 1KB limit
-            large_file = ("large.webm", BytesIO(large_content), "audio/webm")
+            large_file = ("large.webm", large_content, "audio/webm")
 
             response = client.post("/api/v1/audio/upload", files={"file": large_file})
 
@@ -117,93 +144,41 @@ class TestAudioUploadEndpoint:
             assert "details" in data
             assert "max_size" in data["details"]
 
-    def test_upload_webm_format(self, client):
-        """Test upload with WebM format."""
-        webm_file = ("test.webm", BytesIO(b"webm data"), "audio/webm")
-
-        with patch("app.services.upload.upload_service.process_upload") as mock_upload:
-            mock_upload.return_value = {
-                "upload_id": "webm-test",
-                "filename": "test.webm",
-                "file_size": 9,
-                "mime_type": "audio/webm",
-                "status": "uploaded",
-                "created_at": "2025-07-28T12:00:00Z",
-            }
-
-            response = client.post("/api/v1/audio/upload", files={"file": webm_file})
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["mime_type"] == "audio/webm"
-
-    def test_upload_mp4_format(self, client):
-        """Test upload with MP4 format."""
-        mp4_file = ("test.m4a", BytesIO(b"mp4 data"), "audio/mp4")
-
-        with patch("app.services.upload.upload_service.process_upload") as mock_upload:
-            mock_upload.return_value = {
-                "upload_id": "mp4-test",
-                "filename": "test.m4a",
-                "file_size": 8,
-                "mime_type": "audio/mp4",
-                "status": "uploaded",
-                "created_at": "2025-07-28T12:00:00Z",
-            }
-
-            response = client.post("/api/v1/audio/upload", files={"file": mp4_file})
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["mime_type"] == "audio/mp4"
-
-    def test_upload_mp3_format(self, client):
-        """Test upload with MP3 format."""
-        mp3_file = ("test.mp3", BytesIO(b"mp3 data"), "audio/mpeg")
-
-        with patch("app.services.upload.upload_service.process_upload") as mock_upload:
-            mock_upload.return_value = {
-                "upload_id": "mp3-test",
-                "filename": "test.mp3",
-                "file_size": 8,
-                "mime_type": "audio/mpeg",
-                "status": "uploaded",
-                "created_at": "2025-07-28T12:00:00Z",
-            }
+    @pytest.mark.parametrize(
+        "filename,mime_type",
+        [
+            ("test.webm", "audio/webm"),
+            ("test.m4a", "audio/mp4"),
+            ("test.mp3", "audio/mpeg"),
+        ],
+    )
+    def test_upload_format(self, mock_upload, client, filename, mime_type):
+        """Test upload with each supported format."""
+        audio_file = (filename, b"audio data", mime_type)
+        mock_upload.return_value = upload_result(
+            upload_id="format-test", filename=filename, mime_type=mime_type
+        )
 
-            response = client.post("/api/v1/audio/upload", files={"file": mp3_file})
+        response = client.post("/api/v1/audio/upload", files={"file": audio_file})
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["mime_type"] == "audio/mpeg"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["mime_type"] == mime_type
 
-    @patch("app.services.upload.upload_service.process_upload")
-    def test_request_id_in_response(
-        self, mock_process_upload, client, valid_audio_file
-    ):
+    def test_request_id_in_response(self, mock_upload, client, valid_audio_file):
         """Test that request ID is included in response headers."""
-        mock_process_upload.return_value = {
-            "upload_id": "test-id",
-            "filename": "test.webm",
-            "file_size": 19,
-            "mime_type": "audio/webm",
-            "status": "uploaded",
-            "created_at": "2025-07-28T12:00:00Z",
-        }
-
         response = client.post("/api/v1/audio/upload", files={"file": valid_audio_file})
 
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
         assert response.headers["X-Request-ID"] is not None
 
-    @patch("app.services.upload.upload_service.process_upload")
-    def test_server_error_handling(self, mock_process_upload, client, valid_audio_file):
+    def test_server_error_handling(self, mock_upload, client, valid_audio_file):
         """Test server error handling."""
         from app.core.exceptions import ServiceError
 
         # Mock service raising a ServiceError which will be caught properly
-        mock_process_upload.side_effect = ServiceError("Database connection failed")
+        mock_upload.side_effect = ServiceError("Database connection failed")
 
         response = client.post("/api/v1/audio/upload", files={"file": valid_audio_file})
 
@@ -212,79 +187,51 @@ class TestAudioUploadEndpoint:
         assert data["error_code"] == "ServiceError"
         assert "request_id" in data
 
-    def test_cors_headers_present(self, client, valid_audio_file):
+    def test_cors_headers_present(self, mock_upload, client, valid_audio_file):
         """Test that CORS middleware is configured."""
-        with patch("app.services.upload.upload_service.process_upload") as mock_upload:
-            mock_upload.return_value = {
-                "upload_id": "cors-test",
-                "filename": "test.webm",
-                "file_size": 19,
-                "mime_type": "audio/webm",
-                "status": "uploaded",
-                "created_at": "2025-07-28T12:00:00Z",
-            }
-
-            response = client.post(
-                "/api/v1/audio/upload", files={"file": valid_audio_file}
-            )
+        response = client.post("/api/v1/audio/upload", files={"file": valid_audio_file})
 
-            # TestClient doesn't include CORS headers but middleware is configured
-            assert response.status_code == 200
+        # TestClient doesn't include CORS headers but middleware is configured
+        assert response.status_code == 200
 
 
 class TestConcurrentUploads:
     """Test concurrent upload handling."""
 
     @pytest.mark.asyncio
-    async def test_multiple_uploads_different_ids(self, client):
-        """Test that multiple uploads get different IDs."""
-        valid_file = ("test.webm", BytesIO(b"test data"), "audio/webm")
-
-        with patch("app.services.upload.upload_service.process_upload") as mock_upload:
-            # Mock different upload IDs for each call
-            mock_upload.side_effect = [
-                {
-                    "upload_id": "upload-1",
-                    "filename": "test1.webm",
-                    "file_size": 9,
-                    "mime_type": "audio/webm",
-                    "status": "uploaded",
-                    "created_at": "2025-07-28T12:00:00Z",
-                },
-                {
-                    "upload_id": "upload-2",
-                    "filename": "test2.webm",
-                    "file_size": 9,
-                    "mime_type": "audio/webm",
-                    "status": "uploaded",
-                    "created_at": "2025-07-28T12:00:01Z",
-                },
-            ]
-
-            # Make two upload requests
-            response1 = client.post("/api/v1/audio/upload", files={"file": valid_file})
-            response2 = client.post("/api/v1/audio/upload", files={"file": valid_file})
+    async def test_multiple_uploads_different_ids(self, mock_upload):
+        """Test that overlapping uploads get different IDs."""
+        # Mock different upload IDs for each call
+        mock_upload.side_effect = [
+            upload_result(upload_id="upload-1", filename="test1.webm"),
+            upload_result(upload_id="upload-2", filename="test2.webm"),
+        ]
+
+        # Make two upload requests at once; raw bytes can be shared between them
+        valid_file = ("test.webm", b"test data", "audio/webm")
+        async with AsyncClient(app=app, base_url="http://test") as async_client:
+            response1, response2 = await asyncio.gather(
+                *(
+                    async_client.post(
+                        "/api/v1/audio/upload", files={"file": valid_file}
+                    )
+                    for _ in range(2)
+                )
+            )
 
-            assert response1.status_code == 200
-            assert response2.status_code == 200
+        assert response1.status_code == 200
+        assert response2.status_code == 200
 
-            data1 = response1.json()
-            data2 = response2.json()
+        data1 = response1.json()
+        data2 = response2.json()
 
-            # Should have different upload IDs
-            assert data1["upload_id"] != data2["upload_id"]
+        # Should have different upload IDs
+        assert data1["upload_id"] != data2["upload_id"]
 
 
 class TestTranscribeEndpoint:
     """Test audio transcription endpoint."""
 
-    def test_transcribe_endpoint_exists(self, client):
-        """Test that transcribe endpoint exists and accepts POST."""
-        # Test without request body should return 422 (validation error)
-        response = client.post("/api/v1/audio/transcribe")
-        assert response.status_code == 422  # Missing required request body
-
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
     def test_transcribe_success(self, mock_transcribe, client):
         """Test successful transcription."""
         # Mock successful transcription
@@ -321,7 +268,6 @@ class TestTranscribeEndpoint:
             max_summary_words=150,
         )
 
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
     def test_transcribe_with_language(self, mock_transcribe, client):
         """Test transcription with language hint."""
         mock_transcribe.return_value = {
@@ -352,6 +298,7 @@ class TestTranscribeEndpoint:
 
     def test_transcribe_missing_upload_id(self, client):
         """Test transcription without upload_id."""
+        # A 422 rather than 404/405 also shows the endpoint exists and takes POST
         request_data = {}
         response = client.post("/api/v1/audio/transcribe", json=request_data)
 
@@ -367,27 +314,49 @@ class TestTranscribeEndpoint:
 
         assert response.status_code == 422
 
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
-    def test_transcribe_upload_not_found(self, mock_transcribe, client):
-        """Test transcription with non-existent upload."""
+    @pytest.mark.parametrize(
+        "status_code,detail",
+        [
+            (
+                404,
+                {
+                    "error": "Upload nonexistent not found",
+                    "error_code": "UPLOAD_NOT_FOUND",
+                },
+            ),
+            (
+                400,
+                {
+                    "error": "Audio conversion failed",
+                    "error_code": "CONVERSION_ERROR",
+                    "details": "FFmpeg conversion failed",
+                },
+            ),
+            (
+                503,
+                {
+                    "error": "Transcription service unavailable",
+                    "error_code": "SERVICE_UNAVAILABLE",
+                },
+            ),
+        ],
+        ids=["upload_not_found", "conversion_error", "service_unavailable"],
+    )
+    def test_transcribe_http_error(self, mock_transcribe, client, status_code, detail):
+        """Test HTTP errors from the service pass through with their status."""
         from fastapi import HTTPException
 
         mock_transcribe.side_effect = HTTPException(
-            status_code=404,
-            detail={
-                "error": "Upload nonexistent not found",
-                "error_code": "UPLOAD_NOT_FOUND",
-            },
+            status_code=status_code, detail=detail
         )
 
-        request_data = {"upload_id": "nonexistent"}
+        request_data = {"upload_id": "error-test"}
         response = client.post("/api/v1/audio/transcribe", json=request_data)
 
-        assert response.status_code == 404
+        assert response.status_code == status_code
         data = response.json()
-        assert data["error_code"] == "HTTP_404"
+        assert data["error_code"] == f"HTTP_{status_code}"
 
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
     def test_transcribe_timeout(self, mock_transcribe, client):
         """Test transcription timeout."""
         from fastapi import HTTPException
@@ -409,48 +378,6 @@ class TestTranscribeEndpoint:
         assert data["error_code"] == "HTTP_408"
         assert data["details"]["timeout_seconds"] == 300
 
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
-    def test_transcribe_conversion_error(self, mock_transcribe, client):
-        """Test transcription with audio conversion error."""
-        from fastapi import HTTPException
-
-        mock_transcribe.side_effect = HTTPException(
-            status_code=400,
-            detail={
-                "error": "Audio conversion failed",
-                "error_code": "CONVERSION_ERROR",
-                "details": "FFmpeg conversion failed",
-            },
-        )
-
-        request_data = {"upload_id": "bad-audio"}
-        response = client.post("/api/v1/audio/transcribe", json=request_data)
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["error_code"] == "HTTP_400"
-
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
-    def test_transcribe_service_unavailable(self, mock_transcribe, client):
-        """Test transcription when service is unavailable."""
-        from fastapi import HTTPException
-
-        mock_transcribe.side_effect = HTTPException(
-            status_code=503,
-            detail={
-                "error": "Transcription service unavailable",
-                "error_code": "SERVICE_UNAVAILABLE",
-            },
-        )
-
-        request_data = {"upload_id": "service-down"}
-        response = client.post("/api/v1/audio/transcribe", json=request_data)
-
-        assert response.status_code == 503
-        data = response.json()
-        assert data["error_code"] == "HTTP_503"
-
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
     def test_transcribe_server_error(self, mock_transcribe, client):
         """Test transcription server error handling."""
         from app.core.exceptions import ServiceError
@@ -466,7 +393,6 @@ class TestTranscribeEndpoint:
         assert data["error_code"] == "ServiceError"
         assert "request_id" in data
 
-    @patch("app.services.transcription.transcription_service.transcribe_upload")
     def test_transcribe_request_id_in_response(self, mock_transcribe, client):
         """Test that request ID is included in transcription response."""
         mock_transcribe.return_value = {
@@ -488,12 +414,8 @@ class TestTranscribeEndpoint:
         assert "X-Request-ID" in response.headers
         assert response.headers["X-Request-ID"] is not None
 
-    def test_transcribe_endpoint_documentation(self, client):
+    def test_transcribe_endpoint_documentation(self, openapi_spec):
         """Test that transcribe endpoint is documented in OpenAPI."""
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-
-        openapi_spec = response.json()
         paths = openapi_spec.get("paths", {})
         transcribe_path = paths.get("/api/v1/audio/transcribe", {})
 
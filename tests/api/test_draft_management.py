@@ -1,7 +1,9 @@
 """Tests for draft management endpoints."""
 
+import asyncio
+import uuid
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi import status
@@ -10,26 +12,33 @@ from httpx import AsyncClient
 from app.models.session import DraftData, SessionState, SessionStatus, TranscriptionData
 from app.services.session_manager import SessionExpiredError, SessionNotFoundError
 
+# Built once at import; too long for the compiler to constant-fold
+LONG_TRANSCRIPTION = "A" * 50000  # 50k characters
+
+
+def with_draft(session_state: SessionState, **draft_fields) -> SessionState:
+    """Copy session_state with a draft built from draft_fields."""
+    return session_state.model_copy(update={"draft": DraftData(**draft_fields)})
+
 
 class TestDraftManagement:
     """Test suite for draft management functionality."""
 
     @pytest.fixture
-    async def session_with_data(self, async_client: AsyncClient):
+    def session_with_data(self):
         """Create a session with transcription data for testing."""
-        # Create session
-        response = await async_client.post("/api/v1/sessions/")
-        assert response.status_code == status.HTTP_201_CREATED
-        session_data = response.json()
-        session_id = session_data["session_id"]
+        # Every test mocks session_manager, so no real session is needed;
+        # function-scoped because some tests mutate the state
+        session_id = str(uuid.uuid4())
+        now = datetime.utcnow()
 
         # Create proper session state model
         mock_session_state = SessionState(
             session_id=session_id,
             status=SessionStatus.TRANSCRIBED,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(hours=1),
             transcription=TranscriptionData(
                 text="This is a test transcription",
                 language="en",
@@ -59,9 +68,7 @@ class TestDraftManagement:
             "app.services.session_manager.session_manager.update_session_data"
         ) as mock_update:
             # Update session state with draft
-            updated_state = mock_session_state.model_copy()
-            updated_state.draft = DraftData(**draft_data)
-            mock_update.return_value = updated_state
+            mock_update.return_value = with_draft(mock_session_state, **draft_data)
 
             response = await async_client.patch(
                 f"/api/v1/sessions/{session_id}/draft", json=draft_data
@@ -88,9 +95,7 @@ class TestDraftManagement:
         with patch(
             "app.services.session_manager.session_manager.update_session_data"
         ) as mock_update:
-            updated_state = mock_session_state.model_copy()
-            updated_state.draft = DraftData(transcription=draft_data["transcription"])
-            mock_update.return_value = updated_state
+            mock_update.return_value = with_draft(mock_session_state, **draft_data)
 
             response = await async_client.patch(
                 f"/api/v1/sessions/{session_id}/draft", json=draft_data
@@ -212,13 +217,14 @@ class TestDraftManagement:
     async def test_preview_markdown_empty_session(self, async_client: AsyncClient):
         """Test markdown preview with session containing no transcription."""
         session_id = "test-session"
+        now = datetime.utcnow()
 
         mock_session_state = SessionState(
             session_id=session_id,
             status=SessionStatus.CREATED,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            created_at=now,
+            updated_at=now,
+            expires_at=now + timedelta(hours=1),
             transcription=None,
             summary=None,
             keywords=None,
@@ -298,9 +304,8 @@ class TestDraftManagement:
         session_id, mock_session_state = session_with_data
 
         # Test with very long transcription
-        long_transcription = "A" * 50000  # 50k characters
         draft_data = {
-            "transcription": long_transcription,
+            "transcription": LONG_TRANSCRIPTION,
             "summary": ["Test summary"],
             "keywords": ["test"],
         }
@@ -308,9 +313,7 @@ class TestDraftManagement:
         with patch(
             "app.services.session_manager.session_manager.update_session_data"
         ) as mock_update:
-            updated_state = mock_session_state.model_copy()
-            updated_state.draft = DraftData(**draft_data)
-            mock_update.return_value = updated_state
+            mock_update.return_value = with_draft(mock_session_state, **draft_data)
 
             response = await async_client.patch(
                 f"/api/v1/sessions/{session_id}/draft", json=draft_data
@@ -318,7 +321,7 @@ class TestDraftManagement:
 
             assert response.status_code == status.HTTP_200_OK
             data = response.json()
-            assert len(data["draft"]["transcription"]) == 50000
+            assert len(data["draft"]["transcription"]) == len(LONG_TRANSCRIPTION)
 
     async def test_empty_draft_update(
         self, async_client: AsyncClient, session_with_data
@@ -331,9 +334,7 @@ class TestDraftManagement:
         with patch(
             "app.services.session_manager.session_manager.update_session_data"
         ) as mock_update:
-            updated_state = mock_session_state.model_copy()
-            updated_state.draft = DraftData()
-            mock_update.return_value = updated_state
+            mock_update.return_value = with_draft(mock_session_state)
 
             response = await async_client.patch(
                 f"/api/v1/sessions/{session_id}/draft", json=draft_data
@@ -358,27 +359,24 @@ class TestDraftManagement:
         with patch(
             "app.services.session_manager.session_manager.update_session_data"
         ) as mock_update:
-            # First update
-            updated_state_1 = mock_session_state.model_copy()
-            updated_state_1.draft = DraftData(**draft_data_1)
-
-            # Second update
-            updated_state_2 = mock_session_state.model_copy()
-            updated_state_2.draft = DraftData(**draft_data_2)
-
-            mock_update.side_effect = [updated_state_1, updated_state_2]
-
-            response1 = await async_client.patch(
-                f"/api/v1/sessions/{session_id}/draft", json=draft_data_1
+            # Echo back whichever draft each request stored, in any order
+            mock_update.side_effect = lambda _session_id, draft: (
+                mock_session_state.model_copy(update={"draft": draft})
             )
 
-            response2 = await async_client.patch(
-                f"/api/v1/sessions/{session_id}/draft", json=draft_data_2
+            response1, response2 = await asyncio.gather(
+                *(
+                    async_client.patch(
+                        f"/api/v1/sessions/{session_id}/draft", json=draft_data
+                    )
+                    for draft_data in (draft_data_1, draft_data_2)
+                )
             )
 
             assert response1.status_code == status.HTTP_200_OK
             assert response2.status_code == status.HTTP_200_OK
+            assert mock_update.call_count == 2
 
-            # Last update should win
-            data2 = response2.json()
-            assert data2["draft"]["transcription"] == "Second update"
+            # Each request gets back its own update
+            assert response1.json()["draft"]["transcription"] == "First update"
+            assert response2.json()["draft"]["transcription"] == "Second update"
@@ -1,14 +1,23 @@
 """Tests for PWA functionality."""
 
+import asyncio
 import json
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.static_files import build_asset_manifest
+
 
 class TestPWAManifest:
     """Test PWA manifest serving and configuration."""
 
+    @pytest.fixture(scope="class")
+    def manifest(self, client: TestClient):
+        """Fetch and parse the manifest once for the class."""
+        return json.loads(client.get("/manifest.json").content)
+
     def test_manifest_endpoint(self, client: TestClient):
         """Test manifest.json is served correctly."""
         response = client.get("/manifest.json")
@@ -23,11 +32,8 @@ class TestPWAManifest:
         assert manifest["background_color"] == "#1a1a1a"
         assert len(manifest["icons"]) >= 2
 
-    def test_manifest_required_fields(self, client: TestClient):
+    def test_manifest_required_fields(self, manifest):
         """Test manifest has all required PWA fields."""
-        response = client.get("/manifest.json")
-        manifest = response.json()
-
         # Required fields for PWA
         required_fields = [
             "name",
@@ -39,14 +45,11 @@ class TestPWAManifest:
             "background_color",
         ]
 
-        for field in required_fields:
-            assert field in manifest, f"Missing required field: {field}"
+        missing = set(required_fields) - manifest.keys()
+        assert not missing, f"Missing required fields: {sorted(missing)}"
 
-    def test_manifest_icons(self, client: TestClient):
+    def test_manifest_icons(self, manifest):
         """Test manifest icon configuration."""
-        response = client.get("/manifest.json")
-        manifest = response.json()
-
         # Check we have minimum required icon sizes
         icon_sizes = {icon["sizes"] for icon in manifest["icons"]}
         assert "192x192" in icon_sizes, "Missing required 192x192 icon"
@@ -58,11 +61,8 @@ class TestPWAManifest:
         ]
         assert len(maskable_icons) >= 2, "Should have at least 2 maskable icons"
 
-    def test_manifest_shortcuts(self, client: TestClient):
+    def test_manifest_shortcuts(self, manifest):
         """Test manifest app shortcuts."""
-        response = client.get("/manifest.json")
-        manifest = response.json()
-
         assert "shortcuts" in manifest
         assert len(manifest["shortcuts"]) > 0
 
@@ -76,12 +76,9 @@ class TestPWAManifest:
 class TestPWAIntegration:
     """Test PWA integration in HTML."""
 
-    def test_pwa_meta_tags(self, client: TestClient):
+    def test_pwa_meta_tags(self, index_html: str):
         """Test PWA meta tags are present in HTML."""
-        response = client.get("/")
-        assert response.status_code == 200
-
-        html = response.text
+        html = index_html
 
         # Check manifest link
         assert '<link rel="manifest" href="/manifest.json">' in html
@@ -94,18 +91,22 @@ class TestPWAIntegration:
         # Check theme color
         assert '<meta name="theme-color" content="#7c3aed">' in html
 
-    def test_pwa_script_loaded(self, client: TestClient):
+    def test_pwa_script_loaded(self, index_html: str):
         """Test PWA JavaScript is loaded."""
-        response = client.get("/")
-        html = response.text
+        html = index_html
 
-        assert '<script src="/static/js/pwa.js" defer></script>' in html
+        entry = build_asset_manifest(Path("app/static"))["/static/js/pwa.js"]
+        assert (
+            f'<script src="{entry["url"]}" integrity="{entry["integrity"]}"></script>'
+            in html
+        )
 
 
 class TestPWAAssets:
     """Test PWA asset availability."""
 
-    def test_icon_availability(self, client: TestClient):
+    @pytest.mark.asyncio
+    async def test_icon_availability(self, async_client):
         """Test that key PWA icons are available."""
         icon_paths = [
             "/static/assets/icons/icon-192x192.png",
@@ -114,11 +115,23 @@ class TestPWAAssets:
             "/static/assets/icons/icon-512x512-maskable.png",
         ]
 
-        for path in icon_paths:
-            response = client.get(path)
+        # HEAD skips the bodies; gather dispatches the requests together
+        responses = await asyncio.gather(
+            *(async_client.head(path) for path in icon_paths)
+        )
+
+        for path, response in zip(icon_paths, responses):
             assert response.status_code == 200, f"Icon not found: {path}"
             assert response.headers["content-type"] == "image/png"
 
+    def test_icon_cache_control(self, client: TestClient):
+        """Test icons are served with a long-lived cache policy."""
+        response = client.get("/static/assets/icons/icon-512x512.png")
+        assert response.status_code == 200
+        assert (
+            response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        )
+
     def test_pwa_javascript(self, client: TestClient):
         """Test PWA JavaScript file is served."""
         response = client.get("/static/js/pwa.js")
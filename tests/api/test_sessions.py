@@ -1,46 +1,86 @@
 """Tests for session API endpoints."""
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
-
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import create_app
+from app.api import sessions as sessions_api
 from app.models.session import SessionState, SessionStatus
+from app.services.session_manager import SessionExpiredError, SessionNotFoundError
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app()
-    return TestClient(app)
+class FakeSessionManager:
+    """In-memory stand-in for the session manager used by the routes."""
+
+    def __init__(self):
+        self.sessions = {}
+        self.next_id = "test_session_123"
+        # Raised by get_session_state when set
+        self.error = None
+
+    def add(self, session):
+        """Store a session so the routes can find it."""
+        self.sessions[session.session_id] = session
+        return session
+
+    async def create_session(self):
+        """Return next_id, creating that session if needed."""
+        if self.next_id not in self.sessions:
+            self.add(SessionState.model_construct(session_id=self.next_id))
+        return self.next_id
+
+    async def get_session_state(self, session_id):
+        """Return a stored session or raise like the real manager."""
+        if self.error is not None:
+            raise self.error
+        if session_id not in self.sessions:
+            raise SessionNotFoundError(f"Session {session_id} not found")
+        return self.sessions[session_id]
+
+    async def update_session_data(self, session_id, **updates):
+        """Return the stored session; tests add it already updated."""
+        return await self.get_session_state(session_id)
+
+    async def validate_session(self, session_id):
+        """Return whether the session is stored."""
+        return session_id in self.sessions
+
+
+class FakeSessionStorage:
+    """In-memory stand-in for session storage deletes."""
+
+    def __init__(self):
+        self.session_ids = set()
+
+    async def delete_session(self, session_id):
+        """Delete a stored session id, returning whether it existed."""
+        if session_id not in self.session_ids:
+            return False
+        self.session_ids.discard(session_id)
+        return True
 
 
 @pytest.fixture
-def mock_session_manager():
-    """Mock session manager."""
-    with patch("app.api.sessions.session_manager") as mock:
-        yield mock
+def session_manager(monkeypatch):
+    """Install a fresh fake session manager for the routes."""
+    fake = FakeSessionManager()
+    monkeypatch.setattr(sessions_api, "session_manager", fake)
+    return fake
 
 
 @pytest.fixture
-def mock_session_storage():
-    """Mock session storage."""
-    with patch("app.api.sessions.session_storage") as mock:
-        yield mock
+def session_storage(monkeypatch):
+    """Install a fresh fake session storage for the routes."""
+    fake = FakeSessionStorage()
+    monkeypatch.setattr(sessions_api, "session_storage", fake)
+    return fake
 
 
 class TestSessionAPI:
     """Test session API endpoints."""
 
-    def test_create_session_success(self, client, mock_session_manager):
+    def test_create_session_success(self, client, session_manager):
         """Test successful session creation."""
-        # Mock session manager - use AsyncMock for async methods
         test_session_id = "test_session_123"
-        mock_session = SessionState(session_id=test_session_id)
-        mock_session_manager.create_session = AsyncMock(return_value=test_session_id)
-        mock_session_manager.get_session_state = AsyncMock(return_value=mock_session)
+        session_manager.next_id = test_session_id
 
         response = client.post("/api/v1/sessions/")
 
@@ -49,14 +89,15 @@ class TestSessionAPI:
         assert data["session_id"] == test_session_id
         assert data["status"] == "created"
 
-    def test_get_session_success(self, client, mock_session_manager):
+    def test_get_session_success(self, client, session_manager):
         """Test successful session retrieval."""
         session_id = "test_session_123"
-        mock_session = SessionState(
-            session_id=session_id,
-            status=SessionStatus.PROCESSING,
+        session_manager.add(
+            SessionState.model_construct(
+                session_id=session_id,
+                status=SessionStatus.PROCESSING,
+            )
         )
-        mock_session_manager.get_session_state = AsyncMock(return_value=mock_session)
 
         response = client.get(f"/api/v1/sessions/{session_id}")
 
@@ -65,43 +106,35 @@ class TestSessionAPI:
         assert data["session_id"] == session_id
         assert data["status"] == "processing"
 
-    def test_get_session_not_found(self, client, mock_session_manager):
+    def test_get_session_not_found(self, client, session_manager):
         """Test getting non-existent session."""
-        from app.services.session_manager import SessionNotFoundError
-
         session_id = "nonexistent_session"
-        mock_session_manager.get_session_state = AsyncMock(
-            side_effect=SessionNotFoundError(f"Session {session_id} not found")
-        )
 
         response = client.get(f"/api/v1/sessions/{session_id}")
 
         assert response.status_code == 404
         assert "not found" in response.json()["error"].lower()
 
-    def test_get_session_expired(self, client, mock_session_manager):
+    def test_get_session_expired(self, client, session_manager):
         """Test getting expired session."""
-        from app.services.session_manager import SessionExpiredError
-
         session_id = "expired_session"
-        mock_session_manager.get_session_state = AsyncMock(
-            side_effect=SessionExpiredError(f"Session {session_id} has expired")
-        )
+        session_manager.error = SessionExpiredError(f"Session {session_id} has expired")
 
         response = client.get(f"/api/v1/sessions/{session_id}")
 
         assert response.status_code == 410
         assert "expired" in response.json()["error"].lower()
 
-    def test_update_session_success(self, client, mock_session_manager):
+    def test_update_session_success(self, client, session_manager):
         """Test successful session update."""
         session_id = "test_session_123"
-        mock_session = SessionState(
-            session_id=session_id,
-            status=SessionStatus.EDITED,
-            user_edits={"notes": "Test notes"},
+        session_manager.add(
+            SessionState.model_construct(
+                session_id=session_id,
+                status=SessionStatus.EDITED,
+                user_edits={"notes": "Test notes"},
+            )
         )
-        mock_session_manager.update_session_data = AsyncMock(return_value=mock_session)
 
         update_data = {
             "status": "edited",
@@ -115,10 +148,10 @@ class TestSessionAPI:
         assert data["status"] == "edited"
         assert data["user_edits"] == {"notes": "Test notes"}
 
-    def test_delete_session_success(self, client, mock_session_storage):
+    def test_delete_session_success(self, client, session_storage):
         """Test successful session deletion."""
         session_id = "test_session_123"
-        mock_session_storage.delete_session = AsyncMock(return_value=True)
+        session_storage.session_ids.add(session_id)
 
         response = client.delete(f"/api/v1/sessions/{session_id}")
 
@@ -127,25 +160,24 @@ class TestSessionAPI:
         assert data["success"] is True
         assert "deleted successfully" in data["message"]
 
-    def test_delete_session_not_found(self, client, mock_session_storage):
+    def test_delete_session_not_found(self, client, session_storage):
         """Test deleting non-existent session."""
         session_id = "nonexistent_session"
-        mock_session_storage.delete_session = AsyncMock(return_value=False)
 
         response = client.delete(f"/api/v1/sessions/{session_id}")
 
         assert response.status_code == 404
         assert "not found" in response.json()["error"].lower()
 
-    def test_get_session_status_valid(self, client, mock_session_manager):
+    def test_get_session_status_valid(self, client, session_manager):
         """Test getting status of valid session."""
         session_id = "test_session_123"
-        mock_session = SessionState(
-            session_id=session_id,
-            status=SessionStatus.TRANSCRIBED,
+        session_manager.add(
+            SessionState.model_construct(
+                session_id=session_id,
+                status=SessionStatus.TRANSCRIBED,
+            )
         )
-        mock_session_manager.validate_session = AsyncMock(return_value=True)
-        mock_session_manager.get_session_state = AsyncMock(return_value=mock_session)
 
         response = client.get(f"/api/v1/sessions/{session_id}/status")
 
@@ -156,10 +188,9 @@ class TestSessionAPI:
         assert data["status"] == "transcribed"
         assert "expires_at" in data
 
-    def test_get_session_status_invalid(self, client, mock_session_manager):
+    def test_get_session_status_invalid(self, client, session_manager):
         """Test getting status of invalid session."""
         session_id = "invalid_session"
-        mock_session_manager.validate_session = AsyncMock(return_value=False)
 
         response = client.get(f"/api/v1/sessions/{session_id}/status")
 
@@ -169,14 +200,15 @@ class TestSessionAPI:
         assert data["valid"] is False
         assert data["status"] == "expired_or_missing"
 
-    def test_update_session_partial_data(self, client, mock_session_manager):
+    def test_update_session_partial_data(self, client, session_manager):
         """Test updating session with partial data."""
         session_id = "test_session_123"
-        mock_session = SessionState(
-            session_id=session_id,
-            status=SessionStatus.PROCESSING,
+        session_manager.add(
+            SessionState.model_construct(
+                session_id=session_id,
+                status=SessionStatus.PROCESSING,
+            )
         )
-        mock_session_manager.update_session_data = AsyncMock(return_value=mock_session)
 
         # Only update status
         update_data = {"status": "processing"}
@@ -187,12 +219,10 @@ class TestSessionAPI:
         data = response.json()
         assert data["status"] == "processing"
 
-    def test_create_session_empty_request(self, client, mock_session_manager):
+    def test_create_session_empty_request(self, client, session_manager):
         """Test creating session with empty request body."""
         test_session_id = "test_session_123"
-        mock_session = SessionState(session_id=test_session_id)
-        mock_session_manager.create_session = AsyncMock(return_value=test_session_id)
-        mock_session_manager.get_session_state = AsyncMock(return_value=mock_session)
+        session_manager.next_id = test_session_id
 
         # Send empty JSON
         response = client.post("/api/v1/sessions/", json={})
@@ -201,14 +231,12 @@ class TestSessionAPI:
         data = response.json()
         assert data["session_id"] == test_session_id
 
-    def test_session_api_error_handling(self, client, mock_session_manager):
+    def test_session_api_error_handling(self, client, session_manager):
         """Test API error handling for session operations."""
         session_id = "test_session_123"
 
-        # Mock storage error
-        mock_session_manager.get_session_state = AsyncMock(
-            side_effect=Exception("Storage error")
-        )
+        # Simulate a storage error
+        session_manager.error = Exception("Storage error")
 
         response = client.get(f"/api/v1/sessions/{session_id}")
 
@@ -1,10 +1,47 @@
 """Tests for the static recording interface."""
 
+import asyncio
+import os
+import re
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+STATIC_DIR = "app/static"
+
+
+@pytest.fixture(scope="module")
+def static_tree():
+    """Walk app/static once and map each relative path to "dir" or "file"."""
+    tree = {}
+    for root, dirs, files in os.walk(STATIC_DIR):
+        rel_root = os.path.relpath(root, STATIC_DIR)
+        tree[rel_root] = "dir"
+        for name in files:
+            tree[os.path.normpath(os.path.join(rel_root, name))] = "file"
+    return tree
+
+
+def find_tokens(content, tokens):
+    """Return which of tokens occur in content, found in a single scan."""
+    # The lookahead lets tokens that overlap each other all match
+    if isinstance(content, bytes):
+        pattern = b"(?=(" + b"|".join(map(re.escape, tokens)) + b"))"
+    else:
+        pattern = "(?=(" + "|".join(map(re.escape, tokens)) + "))"
+    return {match.group(1) for match in re.finditer(pattern, content)}
+
+
+@pytest.fixture(scope="module")
+def static_bytes():
+    """Read each HTML/CSS/JS asset once, keyed by path relative to app/static."""
+    return {
+        path.relative_to(STATIC_DIR).as_posix(): path.read_bytes()
+        for path in Path(STATIC_DIR).rglob("*")
+        if path.suffix in (".html", ".css", ".js")
+    }
+
 
 class TestStaticInterface:
     """Test the recording interface endpoints."""
@@ -35,32 +72,24 @@ class TestStaticInterface:
         assert "sessions" in endpoints
         assert "vault_save" in endpoints
 
-    def test_static_css_served(self, client: TestClient):
-        """Test that CSS files are served correctly."""
-        response = client.get("/static/css/main.css")
-
-        assert response.status_code == 200
-        assert "text/css" in response.headers["content-type"]
-
-    def test_static_js_served(self, client: TestClient):
-        """Test that JavaScript files are served correctly."""
-        response = client.get("/static/js/recorder.js")
-
-        assert response.status_code == 200
-        assert (
-            "application/javascript" in response.headers["content-type"]
-            or "text/javascript" in response.headers["content-type"]
+    @pytest.mark.asyncio
+    async def test_static_assets_served(self, async_client):
+        """Test that CSS and JavaScript files are served correctly."""
+        expected_types = {
+            "/static/css/main.css": ("text/css",),
+            "/static/js/recorder.js": ("application/javascript", "text/javascript"),
+            "/static/js/ui.js": ("application/javascript", "text/javascript"),
+        }
+
+        # Independent requests, so dispatch them together
+        responses = await asyncio.gather(
+            *(async_client.get(path) for path in expected_types)
         )
 
-    def test_static_js_ui_served(self, client: TestClient):
-        """Test that UI JavaScript file is served correctly."""
-        response = client.get("/static/js/ui.js")
-
-        assert response.status_code == 200
-        assert (
-            "application/javascript" in response.headers["content-type"]
-            or "text/javascript" in response.headers["content-type"]
-        )
+        for (path, types), response in zip(expected_types.items(), responses):
+            assert response.status_code == 200, f"Asset not served: {path}"
+            content_type = response.headers["content-type"]
+            assert any(t in content_type for t in types), f"{path}: {content_type}"
 
     def test_static_file_not_found(self, client: TestClient):
         """Test that non-existent static files return 404."""
@@ -68,33 +97,31 @@ class TestStaticInterface:
 
         assert response.status_code == 404
 
-    def test_html_contains_required_elements(self, client: TestClient):
+    def test_html_contains_required_elements(self, index_html: str):
         """Test that HTML contains required UI elements."""
-        response = client.get("/")
-        html_content = response.text
-
-        # Check for essential HTML structure
-        assert "<!DOCTYPE html>" in html_content
-        assert '<html lang="en">' in html_content
-        assert "viewport" in html_content
-        assert "Dialtone" in html_content
-
-        # Check for recording interface elements
-        assert "record-button" in html_content
-        assert "timer" in html_content
-        assert "status-message" in html_content
-
-        # Check for JavaScript includes
-        assert "/static/js/recorder.js" in html_content
-        assert "/static/js/ui.js" in html_content
-
-        # Check for CSS include
-        assert "/static/css/main.css" in html_content
-
-    def test_html_mobile_optimized(self, client: TestClient):
+        html_content = index_html
+
+        required = {
+            # Check for essential HTML structure
+            "<!DOCTYPE html>",
+            '<html lang="en">',
+            "viewport",
+            "Dialtone",
+            # Check for recording interface elements
+            "record-button",
+            "timer",
+            "status-message",
+            # Check for JavaScript includes
+            "/static/js/recorder.js",
+            "/static/js/ui.js",
+            # Check for CSS include
+            "/static/css/main.css",
+        }
+        assert find_tokens(html_content, required) == required
+
+    def test_html_mobile_optimized(self, index_html: str):
         """Test that HTML is mobile-optimized."""
-        response = client.get("/")
-        html_content = response.text
+        html_content = index_html
 
         # Check for mobile viewport
         assert "width=device-width" in html_content
@@ -106,12 +133,7 @@ class TestStaticInterface:
 
     def test_cors_headers_present(self, client: TestClient):
         """Test that CORS headers are present for web interface."""
-        response = client.get("/")
-
-        # Check that response doesn't fail due to CORS issues
-        assert response.status_code == 200
-
-        # For preflight requests
+        # Root status is covered by test_root_serves_html; check preflight
         options_response = client.options("/api/v1/audio/upload")
         assert options_response.status_code == 200
 
@@ -119,110 +141,98 @@ class TestStaticInterface:
 class TestInterfaceFileStructure:
     """Test that all required static files exist."""
 
-    def test_static_directory_exists(self):
+    def test_static_directory_exists(self, static_tree):
         """Test that static directory exists."""
-        static_dir = Path("app/static")
-        assert static_dir.exists()
-        assert static_dir.is_dir()
+        assert static_tree.get(".") == "dir"
 
-    def test_html_file_exists(self):
+    def test_html_file_exists(self, static_tree):
         """Test that main HTML file exists."""
-        html_file = Path("app/static/index.html")
-        assert html_file.exists()
-        assert html_file.is_file()
+        assert static_tree.get("index.html") == "file"
 
-    def test_css_directory_exists(self):
+    def test_css_directory_exists(self, static_tree):
         """Test that CSS directory exists."""
-        css_dir = Path("app/static/css")
-        assert css_dir.exists()
-        assert css_dir.is_dir()
+        assert static_tree.get("css") == "dir"
 
-    def test_main_css_exists(self):
+    def test_main_css_exists(self, static_tree):
         """Test that main CSS file exists."""
-        css_file = Path("app/static/css/main.css")
-        assert css_file.exists()
-        assert css_file.is_file()
+        assert static_tree.get("css/main.css") == "file"
 
-    def test_js_directory_exists(self):
+    def test_js_directory_exists(self, static_tree):
         """Test that JavaScript directory exists."""
-        js_dir = Path("app/static/js")
-        assert js_dir.exists()
-        assert js_dir.is_dir()
+        assert static_tree.get("js") == "dir"
 
-    def test_recorder_js_exists(self):
+    def test_recorder_js_exists(self, static_tree):
         """Test that recorder JavaScript file exists."""
-        js_file = Path("app/static/js/recorder.js")
-        assert js_file.exists()
-        assert js_file.is_file()
+        assert static_tree.get("js/recorder.js") == "file"
 
-    def test_ui_js_exists(self):
+    def test_ui_js_exists(self, static_tree):
         """Test that UI JavaScript file exists."""
-        js_file = Path("app/static/js/ui.js")
-        assert js_file.exists()
-        assert js_file.is_file()
+        assert static_tree.get("js/ui.js") == "file"
 
-    def test_assets_directory_exists(self):
+    def test_assets_directory_exists(self, static_tree):
         """Test that assets directory exists."""
-        assets_dir = Path("app/static/assets")
-        assert assets_dir.exists()
-        assert assets_dir.is_dir()
+        assert static_tree.get("assets") == "dir"
 
 
 class TestInterfaceContent:
     """Test the content of interface files."""
 
-    def test_css_contains_mobile_styles(self):
+    def test_css_contains_mobile_styles(self, static_bytes):
         """Test that CSS contains mobile-first styles."""
-        css_file = Path("app/static/css/main.css")
-        content = css_file.read_text()
+        content = static_bytes["css/main.css"]
 
         # Check for mobile-first approach
-        assert "@media (max-width:" in content
-        assert "viewport" in content or "vh" in content
-        assert "touch-action" in content
+        assert b"@media (max-width:" in content
+        assert b"viewport" in content or b"vh" in content
+        assert b"touch-action" in content
 
         # Check for design tokens
-        assert ":root" in content
-        assert "--color-" in content
-        assert "--space-" in content
+        assert b":root" in content
+        assert b"--color-" in content
+        assert b"--space-" in content
 
-    def test_recorder_js_contains_required_classes(self):
+    def test_recorder_js_contains_required_classes(self, static_bytes):
         """Test that recorder JS contains required functionality."""
-        js_file = Path("app/static/js/recorder.js")
-        content = js_file.read_text()
-
-        # Check for AudioRecorder class
-        assert "class AudioRecorder" in content
-        assert "MediaRecorder" in content
-        assert "getUserMedia" in content
-        assert "startRecording" in content
-        assert "stopRecording" in content
-
-    def test_ui_js_contains_required_classes(self):
+        content = static_bytes["js/recorder.js"]
+
+        required = {
+            # Check for AudioRecorder class
+            b"class AudioRecorder",
+            b"MediaRecorder",
+            b"getUserMedia",
+            b"startRecording",
+            b"stopRecording",
+        }
+        assert find_tokens(content, required) == required
+
+    def test_ui_js_contains_required_classes(self, static_bytes):
         """Test that UI JS contains required functionality."""
-        js_file = Path("app/static/js/ui.js")
-        content = js_file.read_text()
-
-        # Check for RecorderUI class
-        assert "class RecorderUI" in content
-        assert "DOMContentLoaded" in content
-        assert "addEventListener" in content
-        assert "handleRecordClick" in content
-
-    def test_html_accessibility_features(self):
+        content = static_bytes["js/ui.js"]
+
+        required = {
+            # Check for RecorderUI class
+            b"class RecorderUI",
+            b"DOMContentLoaded",
+            b"addEventListener",
+            b"handleRecordClick",
+        }
+        assert find_tokens(content, required) == required
+
+    def test_html_accessibility_features(self, static_bytes):
         """Test that HTML includes accessibility features."""
-        html_file = Path("app/static/index.html")
-        content = html_file.read_text()
-
-        # Check for ARIA attributes
-        assert "aria-label" in content
-        assert "aria-live" in content
-        assert "role=" in content
-
-        # Check for semantic HTML
-        assert "<main" in content
-        assert "<section" in content
-        assert "<header" in content
+        content = static_bytes["index.html"]
+
+        required = {
+            # Check for ARIA attributes
+            b"aria-label",
+            b"aria-live",
+            b"role=",
+            # Check for semantic HTML
+            b"<main",
+            b"<section",
+            b"<header",
+        }
+        assert find_tokens(content, required) == required
 
         # Check for screen reader support
-        assert "visually-hidden" in content or "sr-only" in content
+        assert b"visually-hidden" in content or b"sr-only" in content
@@ -2,18 +2,9 @@
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
 
 from app.core.exceptions import VaultAccessError, VaultWriteError
-from app.main import app
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
 
 class TestVaultAPI:
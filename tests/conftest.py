@@ -1,7 +1,6 @@
 """Common test fixtures and configuration for integration tests."""
 
 import asyncio
-import json
 import os
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict
@@ -9,7 +8,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 # Set testing environment BEFORE importing settings
 os.environ["TESTING"] = "true"
@@ -17,6 +16,7 @@ os.environ["TESTING"] = "true"
 from app.core.settings import settings
 from app.main import create_app
 from app.models.session import SessionState, SessionStatus
+from app.services.transcription_cache import transcription_cache
 
 
 @pytest.fixture(scope="session")
@@ -27,13 +27,25 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def disable_transcription_cache(monkeypatch):
+    """Keep cached Whisper results from leaking between tests."""
+    monkeypatch.setattr(transcription_cache, "enabled", False)
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create test client for synchronous tests."""
+    """Create one test client for all synchronous tests."""
     app = create_app()
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def index_html(client):
+    """Fetch the recording interface HTML once per module."""
+    return client.get("/").text
+
+
 @pytest.fixture(scope="session")
 async def integration_test_app():
     """FastAPI test app with full service stack for integration tests."""
@@ -44,7 +56,8 @@ async def integration_test_app():
 @pytest.fixture
 async def async_client(integration_test_app) -> AsyncGenerator[AsyncClient, None]:
     """Async client for integration tests."""
-    async with AsyncClient(app=integration_test_app, base_url="http://test") as ac:
+    transport = ASGITransport(app=integration_test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
@@ -1,6 +1,6 @@
 """Tests for rate limiting middleware."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import Request, Response
@@ -0,0 +1,125 @@
+"""Tests for cached static file serving."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from app.core.static_files import (
+    CachedStaticFiles,
+    PreloadedAsset,
+    accepted_encodings,
+    build_asset_manifest,
+    render_index,
+)
+
+MANIFEST = b'{"name": "Dialtone Voice Notes"}' * 20
+
+
+@pytest.fixture
+def static_client(tmp_path):
+    """Serve a temp directory holding a manifest and its gzip variant."""
+    (tmp_path / "manifest.json").write_bytes(MANIFEST)
+    (tmp_path / "manifest.json.gz").write_bytes(gzip.compress(MANIFEST))
+    (tmp_path / "icon.png").write_bytes(b"\x89PNG")
+
+    app = FastAPI()
+    app.mount("/static", CachedStaticFiles(directory=tmp_path), name="static")
+    return TestClient(app)
+
+
+class TestCachedStaticFiles:
+    """Test cache headers and precompressed variant selection."""
+
+    def test_serves_gzip_variant(self, static_client):
+        """Clients accepting gzip get the precompressed file."""
+        response = static_client.get(
+            "/static/manifest.json", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == MANIFEST
+
+    def test_serves_identity_without_gzip(self, static_client):
+        """Clients refusing gzip get the original file."""
+        response = static_client.get(
+            "/static/manifest.json", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.content == MANIFEST
+
+    @pytest.mark.parametrize(
+        "path,cache_control",
+        [
+            ("/static/icon.png", "public, max-age=31536000, immutable"),
+            ("/static/manifest.json", "public, max-age=604800"),
+        ],
+    )
+    def test_cache_control(self, static_client, path, cache_control):
+        """Cache-Control follows the file extension."""
+        response = static_client.get(path)
+
+        assert response.headers["cache-control"] == cache_control
+
+    def test_versioned_url_is_immutable(self, static_client):
+        """A ?v=<hash> URL can be cached for good."""
+        response = static_client.get("/static/manifest.json?v=abc123")
+
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+
+    def test_accepted_encodings_skips_q_zero(self):
+        """Codings with q=0 are refused."""
+        headers = Headers({"accept-encoding": "br;q=0, gzip;q=0.8, deflate"})
+
+        assert accepted_encodings(headers) == ["gzip", "deflate"]
+
+
+class TestAssetManifest:
+    """Test content-hashed asset references."""
+
+    def test_render_index_adds_hash_and_integrity(self, tmp_path):
+        """Known scripts get a hashed URL and an SRI attribute."""
+        (tmp_path / "js").mkdir()
+        (tmp_path / "js" / "app.js").write_bytes(b"console.log('hi');")
+
+        manifest = build_asset_manifest(tmp_path)
+        entry = manifest["/static/js/app.js"]
+        html = render_index(
+            '<script src="/static/js/app.js"></script>'
+            '<script src="/static/js/missing.js"></script>',
+            manifest,
+        )
+
+        assert entry["purpose"] == "script"
+        assert entry["url"] == f"/static/js/app.js?v={entry['sha256'][:12]}"
+        assert f'<script src="{entry["url"]}" integrity="{entry["integrity"]}">' in html
+        assert '<script src="/static/js/missing.js"></script>' in html
+
+
+class TestPreloadedAsset:
+    """Test in-memory serving of constant assets."""
+
+    def test_response_gzip_and_not_modified(self, tmp_path):
+        """Gzip-accepting clients get the compressed body; matching ETags get 304."""
+        path = tmp_path / "manifest.json"
+        path.write_bytes(MANIFEST)
+        asset = PreloadedAsset(path)
+
+        response = asset.response(
+            Headers({"accept-encoding": "gzip"}), "application/manifest+json"
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(response.body) == MANIFEST
+
+        response = asset.response(
+            Headers({"if-none-match": f"W/{asset.etag}"}), "application/json"
+        )
+        assert response.status_code == 304
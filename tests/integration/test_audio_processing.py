@@ -1,7 +1,7 @@
 """Audio processing pipeline integration tests."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Dict
 from unittest.mock import AsyncMock, patch
 
 import pytest
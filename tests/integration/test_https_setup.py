@@ -5,7 +5,6 @@ import socket
 import ssl
 import subprocess
 import time
-from urllib.parse import urljoin
 
 import httpx
 import pytest
@@ -278,6 +277,41 @@ class TestHTTPSSetup:
                 "HTTPS service not running - integration test requires running containers"
             )
 
+    @pytest.mark.asyncio
+    async def test_static_assets_over_http2(self):
+        """Test icons are multiplexed over a single HTTP/2 connection."""
+        pytest.importorskip("h2")
+
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+        icon_paths = [
+            "/static/assets/icons/icon-192x192.png",
+            "/static/assets/icons/icon-512x512.png",
+            "/static/assets/icons/icon-192x192-maskable.png",
+            "/static/assets/icons/icon-512x512-maskable.png",
+        ]
+
+        try:
+            async with httpx.AsyncClient(
+                verify=ssl_context, http2=True, timeout=30.0
+            ) as client:
+                responses = await asyncio.gather(
+                    *(client.get(f"https://localhost{path}") for path in icon_paths)
+                )
+
+            for path, response in zip(icon_paths, responses):
+                assert response.status_code == 200, f"Icon not found: {path}"
+                assert (
+                    response.http_version == "HTTP/2"
+                ), "nginx should negotiate HTTP/2 for static assets"
+
+        except httpx.ConnectError:
+            pytest.skip(
+                "HTTPS service not running - integration test requires running containers"
+            )
+
 
 class TestHTTPSPerformance:
     """Test HTTPS performance characteristics."""
@@ -1,12 +1,11 @@
 """Integration tests for session workflow."""
 
 import asyncio
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from app.models.session import SessionState, SessionStatus
+from app.models.session import SessionStatus
 from app.services.session_manager import SessionManager
 from app.services.session_storage import SessionStorage
 
@@ -3,7 +3,7 @@
 import asyncio
 from pathlib import Path
 from typing import Any, Dict
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
@@ -1,8 +1,7 @@
 """End-to-end voice processing workflow integration tests."""
 
-import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Dict
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -1,10 +1,8 @@
 """Tests for session models."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from uuid import UUID
 
-import pytest
-
 from app.models.session import (
     AudioMetadata,
     SessionCreateRequest,
@@ -3,8 +3,8 @@
 import asyncio
 import time
 from pathlib import Path
-from typing import Any, Dict
-from unittest.mock import AsyncMock, patch
+from typing import Dict
+from unittest.mock import AsyncMock
 
 import psutil
 import pytest
@@ -4,7 +4,7 @@ import asyncio
 import random
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Dict
 from unittest.mock import AsyncMock, patch
 
 import pytest
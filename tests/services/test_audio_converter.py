@@ -1,8 +1,10 @@
 """Tests for audio converter service."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 from fastapi import HTTPException
 
@@ -277,6 +279,103 @@ class TestAudioConverter:
         assert exc_info.value.status_code == 400
         assert "INVALID_AUDIO" in str(exc_info.value.detail)
 
+    async def test_decode_to_ndarray_success(self):
+        """Test decoding ffmpeg's f32le stdout into a float32 array."""
+        samples = np.array([0.0, 0.5, -0.5], dtype=np.float32)
+        process = Mock(returncode=0)
+        process.communicate = AsyncMock(return_value=(samples.tobytes(), b""))
+
+        converter = AudioConverter()
+
+        with patch(
+            "app.services.audio_converter.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ) as mock_exec:
+            audio = await converter.decode_to_ndarray(Path("/test/input.mp3"))
+
+        cmd = mock_exec.call_args.args
+        assert cmd[0] == "ffmpeg"
+        assert "/test/input.mp3" in cmd
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, samples)
+
+    async def test_decode_to_ndarray_ffmpeg_error(self):
+        """Test that a failing ffmpeg decode surfaces as a conversion error."""
+        process = Mock(returncode=1)
+        process.communicate = AsyncMock(return_value=(b"", b"Invalid data"))
+
+        converter = AudioConverter()
+
+        with patch(
+            "app.services.audio_converter.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await converter.decode_to_ndarray(Path("/test/input.mp3"))
+
+        assert exc_info.value.status_code == 400
+        assert "CONVERSION_ERROR" in str(exc_info.value.detail)
+        assert "Invalid data" in str(exc_info.value.detail)
+
+    async def test_decode_to_ndarray_kills_ffmpeg_when_cancelled(self):
+        """Test that cancelling a decode does not leave ffmpeg running."""
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        process = Mock(returncode=None)
+        process.communicate = AsyncMock(side_effect=hang)
+        process.wait = AsyncMock(return_value=-9)
+
+        converter = AudioConverter()
+
+        with patch(
+            "app.services.audio_converter.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            decode = asyncio.create_task(
+                converter.decode_to_ndarray(Path("/test/input.mp3"))
+            )
+            await asyncio.sleep(0.01)
+            decode.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await decode
+
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
+
+    async def test_decode_to_ndarray_limits_concurrent_processes(self):
+        """Test that no more than max_processes ffmpeg decodes run at once."""
+        converter = AudioConverter()
+        converter._process_slots = asyncio.Semaphore(2)
+        running = 0
+        peak = 0
+
+        async def communicate():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return np.zeros(4, dtype=np.float32).tobytes(), b""
+
+        def spawn(*args, **kwargs):
+            process = Mock(returncode=0)
+            process.communicate = communicate
+            return process
+
+        with patch(
+            "app.services.audio_converter.asyncio.create_subprocess_exec",
+            AsyncMock(side_effect=spawn),
+        ):
+            await asyncio.gather(
+                *(converter.decode_to_ndarray(Path(f"/test/{i}.mp3")) for i in range(5))
+            )
+
+        assert peak == 2
+
     def test_global_instance(self):
         """Test global audio_converter instance."""
         assert isinstance(audio_converter, AudioConverter)
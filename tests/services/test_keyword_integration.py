@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from app.services.markdown_formatter import markdown_formatter
@@ -49,15 +50,10 @@ class TestKeywordIntegration:
                 transcribe=AsyncMock(return_value=mock_transcription_result),
             ),
             audio_converter=Mock(
-                get_audio_info=AsyncMock(
-                    return_value={
-                        "duration": 10.0,
-                        "format": "webm",
-                        "sample_rate": 16000,
-                        "channels": 1,
-                    }
+                target_sample_rate=16000,
+                decode_to_ndarray=AsyncMock(
+                    return_value=np.zeros(160000, dtype=np.float32)
                 ),
-                is_conversion_needed=Mock(return_value=False),
             ),
             ollama_service=Mock(
                 health_check=AsyncMock(return_value=True),
@@ -101,15 +97,10 @@ class TestKeywordIntegration:
                 transcribe=AsyncMock(return_value=mock_transcription_result),
             ),
             audio_converter=Mock(
-                get_audio_info=AsyncMock(
-                    return_value={
-                        "duration": 10.0,
-                        "format": "webm",
-                        "sample_rate": 16000,
-                        "channels": 1,
-                    }
+                target_sample_rate=16000,
+                decode_to_ndarray=AsyncMock(
+                    return_value=np.zeros(160000, dtype=np.float32)
                 ),
-                is_conversion_needed=Mock(return_value=False),
             ),
         ):
             result = await transcription_service.transcribe_upload(
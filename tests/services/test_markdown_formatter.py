@@ -3,8 +3,6 @@
 from datetime import datetime
 from unittest.mock import patch
 
-import pytest
-
 from app.services.markdown_formatter import MarkdownFormatter, markdown_formatter
 
 
@@ -6,7 +6,6 @@ from unittest.mock import patch
 
 import pytest
 
-from app.core.exceptions import RateLimitError
 from app.services.rate_limiter import RateLimiterService, TokenBucket
 
 
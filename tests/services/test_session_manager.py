@@ -1,7 +1,7 @@
 """Tests for session manager service."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
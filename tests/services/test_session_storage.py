@@ -4,7 +4,7 @@ import asyncio
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
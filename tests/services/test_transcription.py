@@ -1,13 +1,19 @@
 """Tests for transcription orchestration service."""
 
 import asyncio
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 from fastapi import HTTPException
 
-from app.services.transcription import TranscriptionService, transcription_service
+from app.services.transcription import (
+    ActiveJob,
+    TranscriptionService,
+    transcription_service,
+)
 
 
 class TestTranscriptionService:
@@ -48,6 +54,75 @@ class TestTranscriptionService:
         assert exc_info.value.status_code == 404
         assert "AUDIO_FILE_NOT_FOUND" in str(exc_info.value.detail)
 
+    async def test_transcribe_upload_skips_directories(self, tmp_path):
+        """Test that stray subdirectories are not picked up as the audio file."""
+        upload_dir = tmp_path / "test-upload"
+        upload_dir.mkdir()
+        (upload_dir / "nested").mkdir()
+        audio_file = upload_dir / "test.mp3"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch.object(
+                service, "transcribe_file", AsyncMock(return_value={})
+            ) as mock_transcribe,
+        ):
+            mock_settings.upload_dir = tmp_path
+            await service.transcribe_upload("test-upload")
+
+        mock_transcribe.assert_awaited_once()
+        assert mock_transcribe.call_args.args[0] == audio_file
+
+    async def test_transcribe_upload_uses_metadata(self, tmp_path):
+        """Test that the stored filename is taken from the upload metadata."""
+        upload_dir = tmp_path / "test-upload"
+        upload_dir.mkdir()
+        (upload_dir / "aaa.mp3").write_text("not the upload")
+        audio_file = upload_dir / "test.mp3"
+        audio_file.write_text("fake audio data")
+        (upload_dir / ".meta.json").write_text(
+            json.dumps({"filename": "test.mp3", "mime_type": "audio/mpeg"})
+        )
+
+        service = TranscriptionService()
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch("app.services.transcription.os.scandir") as mock_scandir,
+            patch.object(
+                service, "transcribe_file", AsyncMock(return_value={})
+            ) as mock_transcribe,
+        ):
+            mock_settings.upload_dir = tmp_path
+            await service.transcribe_upload("test-upload")
+
+        mock_scandir.assert_not_called()
+        assert mock_transcribe.call_args.args[0] == audio_file
+
+    async def test_transcribe_upload_bad_metadata_falls_back_to_scan(self, tmp_path):
+        """Test that unreadable metadata falls back to scanning the directory."""
+        upload_dir = tmp_path / "test-upload"
+        upload_dir.mkdir()
+        (upload_dir / ".meta.json").write_text("{not json")
+        audio_file = upload_dir / "test.mp3"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch.object(
+                service, "transcribe_file", AsyncMock(return_value={})
+            ) as mock_transcribe,
+        ):
+            mock_settings.upload_dir = tmp_path
+            await service.transcribe_upload("test-upload")
+
+        assert mock_transcribe.call_args.args[0] == audio_file
+
     @patch("app.services.transcription.whisper_manager")
     @patch("app.services.transcription.audio_converter")
     @patch("app.services.transcription.settings")
@@ -58,13 +133,10 @@ class TestTranscriptionService:
         # Setup mocks
         mock_settings.upload_dir = tmp_path
 
-        mock_converter.get_audio_info.return_value = {
-            "duration": 10.5,
-            "format": "mp3",
-            "sample_rate": 44100,
-            "channels": 2,
-        }
-        mock_converter.is_conversion_needed.return_value = False
+        mock_converter.target_sample_rate = 16000
+        mock_converter.decode_to_ndarray = AsyncMock(
+            return_value=np.zeros(168000, dtype=np.float32)
+        )
 
         mock_whisper.is_loaded = True
         mock_whisper.transcribe.return_value = {
@@ -89,58 +161,46 @@ class TestTranscriptionService:
         assert result["status"] == "completed"
         assert "processing_time_seconds" in result
 
-    @patch("app.services.transcription.whisper_manager")
-    @patch("app.services.transcription.audio_converter")
-    async def test_transcribe_file_with_conversion(
-        self, mock_converter, mock_whisper, tmp_path
-    ):
-        """Test transcription with audio format conversion."""
-        # Setup mocks
-        mock_converter.get_audio_info.return_value = {
-            "duration": 10.5,
-            "format": "mp3",
-            "sample_rate": 44100,
-            "channels": 2,
-        }
-        mock_converter.is_conversion_needed.return_value = True
-
-        converted_file = tmp_path / "converted.wav"
-        converted_file.write_text("converted audio")
-        mock_converter.convert_to_whisper_format.return_value = (converted_file, 10.5)
-
-        mock_whisper.is_loaded = True
-        mock_whisper.transcribe.return_value = {
-            "text": "Converted transcription",
-            "language": "en",
-        }
-
-        # Create test file
+    async def test_transcribe_file_decodes_in_memory(self, tmp_path):
+        """Test that decoded samples go straight to Whisper with no temp file."""
         upload_dir = tmp_path / "test-upload"
         upload_dir.mkdir()
         audio_file = upload_dir / "test.mp3"
         audio_file.write_text("fake audio data")
+        samples = np.zeros(116000, dtype=np.float32)
 
         service = TranscriptionService()
-        result = await service.transcribe_file(audio_file, "test-upload")
 
-        assert result["transcription"]["text"] == "Converted transcription"
-        mock_converter.convert_to_whisper_format.assert_called_once()
+        with (
+            patch("app.services.transcription.audio_converter") as mock_converter,
+            patch("app.services.transcription.whisper_manager") as mock_whisper,
+        ):
+            mock_converter.target_sample_rate = 16000
+            mock_converter.decode_to_ndarray = AsyncMock(return_value=samples)
+            mock_whisper.is_loaded = True
+            mock_whisper.transcribe = AsyncMock(
+                return_value={"text": "hello", "language": "en"}
+            )
 
-        # Verify converted file was cleaned up
-        assert not converted_file.exists()
+            result = await service.transcribe_file(audio_file, "test-upload")
+
+        mock_converter.decode_to_ndarray.assert_awaited_once_with(audio_file)
+        assert mock_whisper.transcribe.call_args.args[0] is samples
+        assert result["transcription"]["duration_seconds"] == 7.25
+        assert list(upload_dir.iterdir()) == [audio_file]
 
     @patch("app.services.transcription.whisper_manager")
     async def test_transcribe_file_model_not_loaded(self, mock_whisper, tmp_path):
         """Test transcription triggers model loading."""
         mock_whisper.is_loaded = False
         mock_whisper.is_loading = False
-        mock_whisper.load_model = AsyncMock()
+        mock_whisper.ensure_loaded = AsyncMock()
 
         # After loading, set as loaded
         async def mock_load():
             mock_whisper.is_loaded = True
 
-        mock_whisper.load_model.side_effect = mock_load
+        mock_whisper.ensure_loaded.side_effect = mock_load
 
         mock_whisper.transcribe.return_value = {
             "text": "Test after loading",
@@ -148,8 +208,10 @@ class TestTranscriptionService:
         }
 
         with patch("app.services.transcription.audio_converter") as mock_converter:
-            mock_converter.get_audio_info.return_value = {"duration": 5.0}
-            mock_converter.is_conversion_needed.return_value = False
+            mock_converter.target_sample_rate = 16000
+            mock_converter.decode_to_ndarray = AsyncMock(
+                return_value=np.zeros(80000, dtype=np.float32)
+            )
 
             # Create test file
             upload_dir = tmp_path / "test-upload"
@@ -160,7 +222,7 @@ class TestTranscriptionService:
             service = TranscriptionService()
             result = await service.transcribe_file(audio_file, "test-upload")
 
-            mock_whisper.load_model.assert_called_once()
+            mock_whisper.ensure_loaded.assert_called_once()
             assert result["transcription"]["text"] == "Test after loading"
 
     @patch("app.services.transcription.whisper_manager")
@@ -176,8 +238,10 @@ class TestTranscriptionService:
         mock_whisper.transcribe.side_effect = slow_transcribe
 
         with patch("app.services.transcription.audio_converter") as mock_converter:
-            mock_converter.get_audio_info.return_value = {"duration": 5.0}
-            mock_converter.is_conversion_needed.return_value = False
+            mock_converter.target_sample_rate = 16000
+            mock_converter.decode_to_ndarray = AsyncMock(
+                return_value=np.zeros(80000, dtype=np.float32)
+            )
 
             # Create test file
             upload_dir = tmp_path / "test-upload"
@@ -212,6 +276,25 @@ class TestTranscriptionService:
         expected = (0.8 + 0.6) / 2
         assert confidence == round(expected, 2)
 
+    def test_calculate_confidence_clips_and_skips_segments(self):
+        """Test that out-of-range log probs are clipped and gaps ignored."""
+        service = TranscriptionService()
+
+        whisper_result = {
+            "text": "Test transcription",
+            "segments": [
+                {"avg_logprob": 0.5},  # clipped to 1.0
+                {"avg_logprob": -3.0},  # clipped to 0.0
+                {"text": "no logprob"},
+                {"avg_logprob": -0.5},
+            ],
+        }
+
+        confidence = service._calculate_confidence(whisper_result)
+
+        assert confidence == 0.5
+        assert isinstance(confidence, float)
+
     def test_calculate_confidence_without_segments(self):
         """Test confidence calculation without segment data."""
         service = TranscriptionService()
@@ -247,10 +330,12 @@ class TestTranscriptionService:
         """Test getting status of active transcription."""
         service = TranscriptionService()
 
-        # Create a mock task
-        mock_task = Mock()
-        mock_task.done.return_value = False
-        service._active_transcriptions["test-id"] = mock_task
+        # Create a mock active job
+        mock_future = Mock()
+        mock_future.done.return_value = False
+        service._active_transcriptions["test-id"] = ActiveJob(
+            future=mock_future, started=0.0, cancel=Mock()
+        )
 
         status = await service.get_transcription_status("test-id")
 
@@ -262,10 +347,12 @@ class TestTranscriptionService:
         """Test getting status of completed transcription."""
         service = TranscriptionService()
 
-        # Create a mock completed task
-        mock_task = Mock()
-        mock_task.done.return_value = True
-        service._active_transcriptions["test-id"] = mock_task
+        # Create a mock completed job
+        mock_future = Mock()
+        mock_future.done.return_value = True
+        service._active_transcriptions["test-id"] = ActiveJob(
+            future=mock_future, started=0.0, cancel=Mock()
+        )
 
         status = await service.get_transcription_status("test-id")
 
@@ -287,16 +374,18 @@ class TestTranscriptionService:
         """Test successful transcription cancellation."""
         service = TranscriptionService()
 
-        # Create a mock active task
-        mock_task = Mock()
-        mock_task.done.return_value = False
-        mock_task.cancel = Mock()
-        service._active_transcriptions["test-id"] = mock_task
+        # Create a mock active job
+        mock_future = Mock()
+        mock_future.done.return_value = False
+        mock_cancel = Mock()
+        service._active_transcriptions["test-id"] = ActiveJob(
+            future=mock_future, started=0.0, cancel=mock_cancel
+        )
 
         result = await service.cancel_transcription("test-id")
 
         assert result is True
-        mock_task.cancel.assert_called_once()
+        mock_cancel.assert_called_once()
 
     async def test_cancel_transcription_not_found(self):
         """Test cancellation of non-existent transcription."""
@@ -310,10 +399,12 @@ class TestTranscriptionService:
         """Test cancellation of completed transcription."""
         service = TranscriptionService()
 
-        # Create a mock completed task
-        mock_task = Mock()
-        mock_task.done.return_value = True
-        service._active_transcriptions["test-id"] = mock_task
+        # Create a mock completed job
+        mock_future = Mock()
+        mock_future.done.return_value = True
+        service._active_transcriptions["test-id"] = ActiveJob(
+            future=mock_future, started=0.0, cancel=Mock()
+        )
 
         result = await service.cancel_transcription("test-id")
 
@@ -338,6 +429,286 @@ class TestTranscriptionService:
         assert status["active_transcriptions"] == 2
         assert "whisper_model" in status
 
+    async def test_transcribe_file_uses_cached_result(self, tmp_path):
+        """Test that a cache hit skips conversion and Whisper entirely."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+        cached = {
+            "result": {"text": "Cached text", "language": "en", "segments": []},
+            "duration": 3.0,
+        }
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch("app.services.transcription.transcription_cache") as mock_cache,
+            patch.object(service, "_run_whisper", AsyncMock()) as mock_run,
+        ):
+            mock_settings.keyword_extraction_enabled = False
+            mock_cache.enabled = True
+            mock_cache.make_key = AsyncMock(return_value="key")
+            mock_cache.get = AsyncMock(return_value=cached)
+
+            result = await service.transcribe_file(audio_file, "test-upload")
+
+        mock_run.assert_not_called()
+        assert result["transcription"]["text"] == "Cached text"
+        assert result["transcription"]["duration_seconds"] == 3.0
+
+    async def test_transcribe_file_stores_result_on_miss(self, tmp_path):
+        """Test that a cache miss runs Whisper and stores the result."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+        whisper_result = {
+            "text": "Fresh text",
+            "language": "en",
+            "segments": [{"avg_logprob": -0.2, "tokens": [1, 2, 3]}],
+        }
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch("app.services.transcription.transcription_cache") as mock_cache,
+            patch.object(
+                service, "_run_whisper", AsyncMock(return_value=(whisper_result, 2.0))
+            ),
+        ):
+            mock_settings.keyword_extraction_enabled = False
+            mock_cache.enabled = True
+            mock_cache.make_key = AsyncMock(return_value="key")
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            result = await service.transcribe_file(audio_file, "test-upload")
+
+        assert result["transcription"]["text"] == "Fresh text"
+        mock_cache.set.assert_awaited_once_with(
+            "key",
+            {
+                "result": {
+                    "text": "Fresh text",
+                    "language": "en",
+                    "segments": [{"avg_logprob": -0.2}],
+                },
+                "duration": 2.0,
+            },
+        )
+
+    async def test_transcribe_file_coalesces_identical_audio(self, tmp_path):
+        """Test that concurrent requests for the same audio share one Whisper run."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+        release = asyncio.Event()
+
+        async def slow_whisper(*args):
+            await release.wait()
+            return {"text": "Shared text", "language": "en"}, 1.0
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch.object(
+                service, "_run_whisper", AsyncMock(side_effect=slow_whisper)
+            ) as mock_run,
+        ):
+            mock_settings.keyword_extraction_enabled = False
+            first = asyncio.create_task(service.transcribe_file(audio_file, "a"))
+            second = asyncio.create_task(service.transcribe_file(audio_file, "b"))
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        mock_run.assert_awaited_once()
+        assert [r["transcription"]["text"] for r in results] == ["Shared text"] * 2
+        assert [r["upload_id"] for r in results] == ["a", "b"]
+        assert service._inflight == {}
+
+    async def test_cancel_one_joined_caller_keeps_shared_run(self, tmp_path):
+        """Test that cancelling one caller of a shared run leaves the others."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+        release = asyncio.Event()
+
+        async def slow_whisper(*args):
+            await release.wait()
+            return {"text": "Shared text", "language": "en"}, 1.0
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch.object(service, "_run_whisper", AsyncMock(side_effect=slow_whisper)),
+        ):
+            mock_settings.keyword_extraction_enabled = False
+            first = asyncio.create_task(service.transcribe_file(audio_file, "a"))
+            second = asyncio.create_task(service.transcribe_file(audio_file, "b"))
+            await asyncio.sleep(0.05)
+
+            # Both callers are tracked, including the one that joined
+            assert (await service.get_transcription_status("b"))["status"] == (
+                "processing"
+            )
+            assert await service.cancel_transcription("a") is True
+            release.set()
+
+            with pytest.raises(HTTPException) as exc_info:
+                await first
+            result = await second
+
+        assert exc_info.value.status_code == 409
+        assert result["transcription"]["text"] == "Shared text"
+        assert service._active_transcriptions == {}
+        assert service._inflight == {}
+
+    async def test_cancel_last_caller_cancels_shared_run(self, tmp_path):
+        """Test that the shared run is cancelled once no callers remain."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio data")
+
+        service = TranscriptionService()
+        whisper_cancelled = asyncio.Event()
+
+        async def hanging_whisper(*args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                whisper_cancelled.set()
+                raise
+
+        with (
+            patch("app.services.transcription.settings") as mock_settings,
+            patch.object(
+                service, "_run_whisper", AsyncMock(side_effect=hanging_whisper)
+            ),
+        ):
+            mock_settings.keyword_extraction_enabled = False
+            first = asyncio.create_task(service.transcribe_file(audio_file, "a"))
+            second = asyncio.create_task(service.transcribe_file(audio_file, "b"))
+            await asyncio.sleep(0.05)
+
+            assert await service.cancel_transcription("a") is True
+            assert not whisper_cancelled.is_set()
+            assert await service.cancel_transcription("b") is True
+
+            results = await asyncio.gather(first, second, return_exceptions=True)
+            await asyncio.wait_for(whisper_cancelled.wait(), timeout=1)
+
+        assert all(isinstance(r, HTTPException) for r in results)
+        assert service._inflight == {}
+
+    async def test_admission_slot_limits_concurrency(self):
+        """Test that no more than max_concurrent callers hold a slot."""
+        service = TranscriptionService()
+        service.max_concurrent = 1
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with service._admission_slot():
+                await release.wait()
+
+        first = asyncio.create_task(hold_slot())
+        second = asyncio.create_task(hold_slot())
+        await asyncio.sleep(0)
+
+        assert service._active_count == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert service._active_count == 0
+
+    async def test_admission_slot_survives_cancelled_waiter(self):
+        """Test that a waiter cancelled after being woken does not strand others."""
+        service = TranscriptionService()
+        service.max_concurrent = 1
+
+        async def use_slot():
+            async with service._admission_slot():
+                pass
+
+        slot = service._admission_slot()
+        await slot.__aenter__()
+        woken = asyncio.create_task(use_slot())
+        waiting = asyncio.create_task(use_slot())
+        await asyncio.sleep(0)
+
+        # Releasing wakes the first waiter, which is cancelled before it runs
+        await slot.__aexit__(None, None, None)
+        woken.cancel()
+
+        await asyncio.wait_for(waiting, timeout=1)
+        with pytest.raises(asyncio.CancelledError):
+            await woken
+        assert service._active_count == 0
+
+    async def test_set_max_concurrent_admits_waiters(self):
+        """Test that raising the limit at runtime wakes queued callers."""
+        service = TranscriptionService()
+        service.max_concurrent = 1
+        release = asyncio.Event()
+
+        async def hold_slot():
+            async with service._admission_slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold_slot()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert service._active_count == 1
+
+        await service.set_max_concurrent(3)
+        await asyncio.sleep(0)
+        assert service._active_count == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert service._active_count == 0
+
+    async def test_set_max_concurrent_rejects_invalid_limit(self):
+        """Test that the limit cannot be set below one."""
+        service = TranscriptionService()
+
+        with pytest.raises(ValueError):
+            await service.set_max_concurrent(0)
+
+    async def test_active_job_tracked_while_running(self):
+        """Test that a running Whisper call is tracked as a job and then dropped."""
+        service = TranscriptionService()
+        release = asyncio.Event()
+
+        async def slow_transcribe(*args, **kwargs):
+            await release.wait()
+            return {"text": "done"}
+
+        with (
+            patch("app.services.transcription.audio_converter") as mock_converter,
+            patch("app.services.transcription.whisper_manager") as mock_whisper,
+        ):
+            mock_converter.target_sample_rate = 16000
+            mock_converter.decode_to_ndarray = AsyncMock(
+                return_value=np.zeros(16000, dtype=np.float32)
+            )
+            mock_whisper.is_loaded = True
+            mock_whisper.transcribe = slow_transcribe
+
+            run = asyncio.create_task(
+                service._run_whisper_shared("key", Path("test.wav"), "test-id", None)
+            )
+            await asyncio.sleep(0.01)
+
+            job = service._active_transcriptions["test-id"]
+            assert isinstance(job, ActiveJob)
+            status = await service.get_transcription_status("test-id")
+            assert status["status"] == "processing"
+
+            release.set()
+            await run
+
+        assert job.future.done()
+        assert "test-id" not in service._active_transcriptions
+
     def test_global_instance(self):
         """Test global transcription_service instance."""
         assert isinstance(transcription_service, TranscriptionService)
@@ -355,13 +726,10 @@ class TestTranscriptionService:
         audio_file.write_text("fake audio data")
 
         mock_settings.upload_dir = tmp_path
-        mock_converter.get_audio_info.return_value = {
-            "duration": 30.0,
-            "format": "wav",
-            "sample_rate": 16000,
-            "channels": 1,
-        }
-        mock_converter.is_conversion_needed.return_value = False
+        mock_converter.target_sample_rate = 16000
+        mock_converter.decode_to_ndarray = AsyncMock(
+            return_value=np.zeros(480000, dtype=np.float32)
+        )
 
         mock_whisper.is_loaded = True
         mock_whisper.is_loading = False
@@ -417,13 +785,10 @@ class TestTranscriptionService:
         audio_file.write_text("fake audio data")
 
         mock_settings.upload_dir = tmp_path
-        mock_converter.get_audio_info.return_value = {
-            "duration": 30.0,
-            "format": "wav",
-            "sample_rate": 16000,
-            "channels": 1,
-        }
-        mock_converter.is_conversion_needed.return_value = False
+        mock_converter.target_sample_rate = 16000
+        mock_converter.decode_to_ndarray = AsyncMock(
+            return_value=np.zeros(480000, dtype=np.float32)
+        )
 
         mock_whisper.is_loaded = True
         mock_whisper.is_loading = False
@@ -465,13 +830,10 @@ class TestTranscriptionService:
         audio_file.write_text("fake audio data")
 
         mock_settings.upload_dir = tmp_path
-        mock_converter.get_audio_info.return_value = {
-            "duration": 30.0,
-            "format": "wav",
-            "sample_rate": 16000,
-            "channels": 1,
-        }
-        mock_converter.is_conversion_needed.return_value = False
+        mock_converter.target_sample_rate = 16000
+        mock_converter.decode_to_ndarray = AsyncMock(
+            return_value=np.zeros(480000, dtype=np.float32)
+        )
 
         mock_whisper.is_loaded = True
         mock_whisper.is_loading = False
@@ -515,13 +877,10 @@ class TestTranscriptionService:
         audio_file.write_text("fake audio data")
 
         mock_settings.upload_dir = tmp_path
-        mock_converter.get_audio_info.return_value = {
-            "duration": 30.0,
-            "format": "wav",
-            "sample_rate": 16000,
-            "channels": 1,
-        }
-        mock_converter.is_conversion_needed.return_value = False
+        mock_converter.target_sample_rate = 16000
+        mock_converter.decode_to_ndarray = AsyncMock(
+            return_value=np.zeros(480000, dtype=np.float32)
+        )
 
         mock_whisper.is_loaded = True
         mock_whisper.is_loading = False
@@ -0,0 +1,133 @@
+"""Tests for transcription result cache."""
+
+import hashlib
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.transcription_cache import TranscriptionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create TranscriptionCache instance with temp directory."""
+    with patch("app.services.transcription_cache.settings") as mock_settings:
+        mock_settings.transcription_cache_enabled = True
+        mock_settings.transcription_cache_dir = tmp_path / "cache"
+        mock_settings.transcription_cache_ttl_hours = 1
+        return TranscriptionCache()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Create a small fake audio file."""
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"fake audio data")
+    return path
+
+
+class TestTranscriptionCache:
+    """Test transcription cache operations."""
+
+    async def test_make_key_depends_on_content_language_and_model(
+        self, cache, audio_file, tmp_path
+    ):
+        """Test that keys change with content, language and model settings."""
+        other_file = tmp_path / "other.wav"
+        other_file.write_bytes(b"other audio data")
+
+        key = await cache.make_key(audio_file, "en", "base", "int8", True)
+
+        assert key == await cache.make_key(audio_file, "en", "base", "int8", True)
+        assert key != await cache.make_key(other_file, "en", "base", "int8", True)
+        assert key != await cache.make_key(audio_file, "es", "base", "int8", True)
+        assert key != await cache.make_key(audio_file, "en", "small", "int8", True)
+        assert key != await cache.make_key(audio_file, "en", "base", "float32", True)
+        assert key != await cache.make_key(audio_file, "en", "base", "int8", False)
+
+    async def test_make_key_streams_file_in_chunks(
+        self, cache, audio_file, monkeypatch
+    ):
+        """Test that chunked hashing matches hashing the whole file at once."""
+        monkeypatch.setattr("app.services.transcription_cache.HASH_CHUNK_SIZE", 4)
+
+        key = await cache.make_key(audio_file, "en", "base", "int8", True)
+
+        expected = hashlib.sha256(
+            b"fake audio data" + b"\0en\0base\0int8\0" + b"1"
+        ).hexdigest()
+        assert key == expected
+
+    async def test_set_and_get_round_trip(self, cache, audio_file):
+        """Test that stored payloads are returned on lookup."""
+        key = await cache.make_key(audio_file, None, "base", "int8", True)
+        payload = {"result": {"text": "hello", "language": "en"}, "duration": 1.5}
+
+        assert await cache.get(key) is None
+
+        await cache.set(key, payload)
+
+        assert await cache.get(key) == payload
+
+    async def test_expired_entry_is_ignored(self, cache, audio_file):
+        """Test that entries older than the TTL are treated as misses."""
+        key = await cache.make_key(audio_file, None, "base", "int8", True)
+        await cache.set(key, {"result": {}, "duration": 0.0})
+
+        with patch(
+            "app.services.transcription_cache.time.time",
+            return_value=time.time() + cache.ttl_seconds + 1,
+        ):
+            assert await cache.get(key) is None
+
+        assert not cache._get_entry_path(key).exists()
+
+    async def test_corrupted_entry_is_a_miss(self, cache):
+        """Test that unreadable entries do not raise."""
+        cache.cache_dir.mkdir(parents=True)
+        cache._get_entry_path("broken").write_text("not json")
+
+        assert await cache.get("broken") is None
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            "[1, 2]",
+            '{"payload": {}}',
+            '{"created_at": 1}',
+            '{"created_at": "soon", "payload": {}}',
+            '{"created_at": 1, "payload": [1]}',
+        ],
+    )
+    async def test_malformed_entry_is_a_miss(self, cache, contents):
+        """Test that valid JSON of the wrong shape is treated as a miss."""
+        cache.cache_dir.mkdir(parents=True)
+        cache._get_entry_path("malformed").write_text(contents)
+
+        assert await cache.get("malformed") is None
+
+    async def test_failed_set_leaves_no_partial_entry(self, cache):
+        """Test that a failed write leaves neither the entry nor a temp file."""
+        with patch(
+            "app.services.transcription_cache.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            await cache.set("key", {"duration": 1.0})
+
+        assert await cache.get("key") is None
+        assert list(cache.cache_dir.iterdir()) == []
+
+    async def test_purge_expired(self, cache):
+        """Test purging removes only stale entries."""
+        await cache.set("fresh", {"duration": 1.0})
+        await cache.set("stale", {"duration": 1.0})
+        stale_time = time.time() - cache.ttl_seconds - 60
+        os.utime(cache._get_entry_path("stale"), (stale_time, stale_time))
+
+        removed = await cache.purge_expired()
+
+        assert removed == 1
+        assert cache._get_entry_path("fresh").exists()
+        assert not cache._get_entry_path("stale").exists()
@@ -1,5 +1,8 @@
 """Tests for upload service."""
 
+import json
+import uuid
+from io import BytesIO
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -22,6 +25,7 @@ def mock_upload_file():
     file.content_type = "audio/webm"
     file.size = 1024
     file.read = AsyncMock(return_value=b"fake audio data")
+    file.file = BytesIO(b"fake audio data")
     return file
 
 
@@ -55,6 +59,13 @@ class TestUploadService:
         assert len(upload_id) == 36  # UUID4 format
         assert "-" in upload_id
 
+    def test_generate_upload_id_unique_uuid4(self, upload_service):
+        """Test that pooled upload IDs are valid, unique UUID4s across refills."""
+        ids = [upload_service.generate_upload_id() for _ in range(2500)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(upload_id).version == 4 for upload_id in ids)
+
     def test_generate_filename(self, upload_service):
         """Test filename generation."""
         upload_id = "test-123"
@@ -133,8 +144,8 @@ class TestUploadService:
         upload_service.upload_dir = tmp_path
         upload_id = "test-upload-123"
 
-        # Mock file reading
-        mock_upload_file.read = AsyncMock(side_effect=[b"test data", b""])
+        # Mock spooled file contents
+        mock_upload_file.file = BytesIO(b"test data")
 
         filename, size = await upload_service.save_file(mock_upload_file, upload_id)
 
@@ -147,6 +158,36 @@ class TestUploadService:
         assert upload_path.exists()
         assert (upload_path / filename).exists()
 
+    @pytest.mark.asyncio
+    async def test_save_file_writes_metadata(
+        self, upload_service, mock_upload_file, tmp_path
+    ):
+        """Test that the stored filename is recorded alongside the upload."""
+        from app.services.upload import UPLOAD_META_FILENAME
+
+        upload_service.upload_dir = tmp_path
+        mock_upload_file.file = BytesIO(b"test data")
+
+        filename, _ = await upload_service.save_file(mock_upload_file, "test-upload")
+
+        meta = json.loads((tmp_path / "test-upload" / UPLOAD_META_FILENAME).read_text())
+        assert meta["filename"] == filename
+        assert meta["mime_type"] == mock_upload_file.content_type
+
+    @pytest.mark.asyncio
+    async def test_save_file_reads_large_chunks(
+        self, upload_service, mock_upload_file, tmp_path
+    ):
+        """Test that uploads are copied in UPLOAD_CHUNK_SIZE reads."""
+        from app.services.upload import UPLOAD_CHUNK_SIZE
+
+        upload_service.upload_dir = tmp_path
+        mock_upload_file.file = Mock(wraps=BytesIO(b"test data"))
+
+        await upload_service.save_file(mock_upload_file, "test-upload-123")
+
+        mock_upload_file.file.read.assert_called_with(UPLOAD_CHUNK_SIZE)
+
     @pytest.mark.asyncio
     async def test_save_file_size_exceeded_during_upload(
         self, upload_service, tmp_path
@@ -160,10 +201,8 @@ class TestUploadService:
         file.content_type = "audio/webm"
         file.size = 5  # Smaller than limit initially
 
-        # Mock reading that exceeds limit
-        file.read = AsyncMock(
-            side_effect=[b"x" * 15, b""]
-        )  # 15 bytes exceeds 10 byte limit
+        # Spooled contents that exceed the limit
+        file.file = BytesIO(b"x" * 15)  # 15 bytes exceeds 10 byte limit
 
         from app.core.exceptions import FileSizeError
 
@@ -180,6 +219,7 @@ class TestUploadService:
         """Test complete upload process."""
         upload_service.upload_dir = tmp_path
         mock_upload_file.read = AsyncMock(side_effect=[b"test audio data", b""])
+        mock_upload_file.file = BytesIO(b"test audio data")
 
         try:
             result = await upload_service.process_upload(mock_upload_file)
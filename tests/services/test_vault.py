@@ -1,8 +1,10 @@
 """Tests for vault service."""
 
 import asyncio
+import errno
+import os
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -11,6 +13,7 @@ from app.core.exceptions import (
     VaultConfigurationError,
     VaultWriteError,
 )
+from app.services.markdown_formatter import markdown_formatter
 from app.services.vault import VaultService
 
 
@@ -19,6 +22,7 @@ def mock_settings(tmp_path):
     """Mock settings with temp vault path."""
     with patch("app.services.vault.settings") as mock:
         mock.obsidian_vault_path = tmp_path / "test_vault"
+        mock.vault_direct_io = False
         yield mock
 
 
@@ -115,7 +119,7 @@ class TestVaultService:
         with patch.object(vault_service, "_validate_vault_access", return_value=None):
             with patch.object(
                 vault_service,
-                "_atomic_write",
+                "_write_temp_sync",
                 side_effect=VaultWriteError("Failed to save file to vault"),
             ):
                 with pytest.raises(VaultWriteError) as exc_info:
@@ -126,6 +130,227 @@ class TestVaultService:
 
         assert "Failed to save file to vault" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_write_batch(self, vault_service, tmp_path):
+        """Test that one batch formats and writes every save's files."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        save = {
+            "upload_id": "test123",
+            "transcription": "Body of the note.",
+            "transcript_content": "Body of the note.",
+            "summary": "- Point",
+            "keywords": None,
+            "metadata": None,
+            "title": "Team Sync",
+            "tags": [],
+        }
+
+        results = await asyncio.to_thread(vault_service._write_batch_sync, [save, save])
+
+        paths = set()
+        for note_path, transcript_path, note_size, transcript_size in results:
+            assert note_path.parent == transcript_path.parent == vault_path
+            assert note_path.stat().st_size == note_size
+            assert "Body of the note." in transcript_path.read_text()
+            assert transcript_path.stat().st_size == transcript_size
+            paths.update([note_path, transcript_path])
+        # Same title twice in a batch still gets four distinct files
+        assert len(paths) == 4
+        assert not list(vault_path.glob("*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_share_a_batch(self, vault_service, tmp_path):
+        """Test that saves arriving during a batch are flushed together next."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        with patch.object(
+            vault_service,
+            "_write_batch_sync",
+            wraps=vault_service._write_batch_sync,
+        ) as mock_batch:
+            results = await asyncio.gather(
+                *(
+                    vault_service.save_transcription_to_vault(
+                        f"id{i}", "Same words", title="Standup"
+                    )
+                    for i in range(4)
+                )
+            )
+
+        batch_sizes = [len(call.args[0]) for call in mock_batch.call_args_list]
+        assert sum(batch_sizes) == 4
+        assert len(batch_sizes) < 4
+        assert len({result["note_filename"] for result in results}) == 4
+        assert vault_service._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_write_batch_isolates_failed_save(self, vault_service, tmp_path):
+        """Test that a failed write publishes none of that save's files."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        write_temp = vault_service._write_temp_sync
+
+        def fail_for_bad(file_path, content, fsync=True):
+            if file_path.name.startswith("bad"):
+                raise VaultWriteError("disk full")
+            write_temp(file_path, content, fsync)
+
+        saves = [
+            {
+                "upload_id": title,
+                "transcription": "Text",
+                "transcript_content": "Text",
+                "summary": None,
+                "keywords": None,
+                "metadata": None,
+                "title": title,
+                "tags": [],
+            }
+            for title in ("Good", "Bad")
+        ]
+
+        with patch.object(vault_service, "_write_temp_sync", fail_for_bad):
+            good, bad = vault_service._write_batch_sync(saves)
+
+        assert isinstance(bad, VaultWriteError)
+        assert good[0].exists() and good[1].exists()
+        assert sorted(p.name for p in vault_path.iterdir()) == sorted(
+            [good[0].name, good[1].name]
+        )
+
+    @pytest.mark.asyncio
+    async def test_write_batch_syncs_filesystem_once(self, vault_service, tmp_path):
+        """Test that a batch replaces per-file fsyncs with one syncfs."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        vault_service._validate_vault_access_sync()
+        save = {
+            "upload_id": "test123",
+            "transcription": "Text",
+            "transcript_content": "Text",
+            "summary": None,
+            "keywords": None,
+            "metadata": None,
+            "title": "Sync",
+            "tags": [],
+        }
+
+        try:
+            with (
+                patch("app.services.vault._SYNCFS") as mock_syncfs,
+                patch("app.services.vault.os.fsync") as mock_fsync,
+            ):
+                results = vault_service._write_batch_sync([save, save])
+
+            mock_syncfs.assert_called_once_with(vault_service._dir_fd)
+            mock_fsync.assert_not_called()
+            assert all(path.exists() for result in results for path in result[:2])
+
+            with patch(
+                "app.services.vault._SYNCFS", side_effect=OSError(5, "I/O error")
+            ):
+                (failed,) = vault_service._write_batch_sync([save])
+
+            assert isinstance(failed, VaultWriteError)
+            assert len(list(vault_path.iterdir())) == 4
+        finally:
+            vault_service.close()
+
+    @pytest.mark.asyncio
+    async def test_write_temp_encodes_utf8(self, vault_service, tmp_path):
+        """Test that temp files hold the content's exact UTF-8 bytes."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        target = vault_path / "note.md"
+        content = "Café notes — ünïcode ✓\n" * 100
+
+        vault_service._write_temp_sync(target, content)
+        vault_service._replace_sync(target)
+
+        assert target.read_bytes() == content.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_write_temp_preallocates(self, vault_service, tmp_path):
+        """Test that temp files are preallocated to the encoded length."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        target = vault_path / "note.md"
+
+        with patch(
+            "app.services.vault.os.posix_fallocate", create=True
+        ) as mock_fallocate:
+            vault_service._write_temp_sync(target, "naïve")
+        vault_service._replace_sync(target)
+
+        mock_fallocate.assert_called_once()
+        assert mock_fallocate.call_args.args[1:] == (0, len("naïve".encode()))
+        assert target.read_text() == "naïve"
+
+    @pytest.mark.asyncio
+    async def test_write_temp_without_fallocate_support(self, vault_service, tmp_path):
+        """Test that filesystems without fallocate still get the write."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        target = vault_path / "note.md"
+
+        with patch(
+            "app.services.vault.os.posix_fallocate",
+            side_effect=OSError(errno.EOPNOTSUPP, "not supported"),
+            create=True,
+        ):
+            vault_service._write_temp_sync(target, "content")
+        vault_service._replace_sync(target)
+
+        assert target.read_text() == "content"
+
+    @pytest.mark.asyncio
+    async def test_write_temp_direct_io(self, vault_service, tmp_path):
+        """Test O_DIRECT writes, falling back where the filesystem refuses."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        target = vault_path / "note.md"
+        content = "Direct write ✓\n" * 500
+        vault_service._direct_io = True
+
+        with patch.object(
+            vault_service,
+            "_write_direct_sync",
+            wraps=vault_service._write_direct_sync,
+        ) as mock_direct:
+            vault_service._write_temp_sync(target, content)
+        vault_service._replace_sync(target)
+
+        mock_direct.assert_called_once()
+        assert target.read_bytes() == content.encode("utf-8")
+
+        with patch.object(
+            vault_service,
+            "_write_direct_sync",
+            side_effect=OSError(errno.EINVAL, "Invalid argument"),
+        ):
+            vault_service._write_temp_sync(target, "buffered")
+        vault_service._replace_sync(target)
+
+        assert vault_service._direct_io is False
+        assert target.read_text() == "buffered"
+
+    @pytest.mark.asyncio
+    async def test_failed_rename_cleans_up_temp_file(self, vault_service, tmp_path):
+        """Test that a failed rename leaves neither target nor temp file."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        target = vault_path / "note.md"
+
+        vault_service._write_temp_sync(target, "content")
+        with patch("app.services.vault.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(VaultWriteError):
+                vault_service._replace_sync(target)
+
+        assert not target.exists()
+        assert not (vault_path / "note.md.tmp").exists()
+
     @pytest.mark.asyncio
     async def test_vault_status(self, vault_service, tmp_path):
         """Test vault status reporting."""
@@ -139,6 +364,168 @@ class TestVaultService:
         assert "free_space_gb" in status
         assert "total_space_gb" in status
 
+    @pytest.mark.asyncio
+    async def test_writes_relative_to_vault_dir_fd(self, vault_service, tmp_path):
+        """Test that saves resolve names against the held vault directory fd."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        with patch("app.services.vault.os.replace", wraps=os.replace) as mock_replace:
+            result = await vault_service.save_transcription_to_vault("a", "Note")
+
+        try:
+            assert vault_service._dir_fd is not None
+            for call in mock_replace.call_args_list:
+                assert "/" not in call.args[1]
+                assert call.kwargs["dst_dir_fd"] == vault_service._dir_fd
+            assert (vault_path / result["note_filename"]).exists()
+            assert not list(vault_path.glob("*.tmp"))
+        finally:
+            vault_service.close()
+
+        assert vault_service._dir_fd is None
+
+    @pytest.mark.asyncio
+    async def test_dir_fd_reopened_when_vault_replaced(self, vault_service, tmp_path):
+        """Test that a recreated vault directory gets a fresh fd."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        try:
+            await vault_service._validate_vault_access()
+            first_fd = vault_service._dir_fd
+
+            vault_path.rmdir()
+            vault_path.mkdir()
+            vault_service._validate_vault_access_sync()
+
+            assert vault_service._dir_fd != first_fd
+            assert vault_service._retired_dir_fds == [first_fd]
+            vault_service._write_temp_sync(vault_path / "note.md", "content")
+            vault_service._replace_sync(vault_path / "note.md")
+            assert (vault_path / "note.md").read_text() == "content"
+        finally:
+            vault_service.close()
+
+    @pytest.mark.asyncio
+    async def test_tags_generated_while_vault_validates(self, vault_service, tmp_path):
+        """Test that tag generation overlaps vault validation."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        tags_started = asyncio.Event()
+
+        async def health_check():
+            tags_started.set()
+            return True
+
+        async def validate(write_probe=True):
+            # Only completes if tag generation runs concurrently
+            await asyncio.wait_for(tags_started.wait(), timeout=1)
+
+        with (
+            patch("app.services.ollama.ollama_service") as mock_ollama,
+            patch.object(vault_service, "_validate_vault_access", validate),
+        ):
+            mock_ollama.health_check = health_check
+            mock_ollama.generate_tags = AsyncMock(return_value=["standup"])
+            result = await vault_service.save_transcription_to_vault("a", "Words")
+
+        note = (vault_path / result["note_filename"]).read_text()
+        assert "standup" in note
+
+    @pytest.mark.asyncio
+    async def test_transcript_formatted_before_tags_arrive(
+        self, vault_service, tmp_path
+    ):
+        """Test that the transcript is formatted while tags are generated."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        transcript_formatted = asyncio.Event()
+        format_transcript = markdown_formatter.format_transcript
+        loop = asyncio.get_running_loop()
+
+        def formatted(**kwargs):
+            content = format_transcript(**kwargs)
+            loop.call_soon_threadsafe(transcript_formatted.set)
+            return content
+
+        async def generate_tags(text, max_tags):
+            # Only completes if the transcript is formatted in parallel
+            await asyncio.wait_for(transcript_formatted.wait(), timeout=1)
+            return ["standup"]
+
+        with (
+            patch("app.services.ollama.ollama_service") as mock_ollama,
+            patch.object(markdown_formatter, "format_transcript", formatted),
+        ):
+            mock_ollama.health_check = AsyncMock(return_value=True)
+            mock_ollama.generate_tags = generate_tags
+            result = await vault_service.save_transcription_to_vault("a", "Words")
+
+        transcript = vault_path / result["transcript_filename"]
+        assert "Words" in transcript.read_text()
+
+    @pytest.mark.asyncio
+    async def test_write_probe_skipped_until_write_fails(self, vault_service, tmp_path):
+        """Test that saves after a successful probe only check permissions."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        with patch.object(
+            vault_service,
+            "_probe_write_sync",
+            wraps=vault_service._probe_write_sync,
+        ) as mock_probe:
+            await vault_service.probe_writable()
+            await vault_service.save_transcription_to_vault("a", "First note")
+            await vault_service.save_transcription_to_vault("b", "Second note")
+            assert mock_probe.call_count == 1
+
+            with patch.object(
+                vault_service,
+                "_write_temp_sync",
+                side_effect=VaultWriteError("boom"),
+            ):
+                with pytest.raises(VaultWriteError):
+                    await vault_service.save_transcription_to_vault("c", "Third")
+            assert mock_probe.call_count == 1
+
+            await vault_service.save_transcription_to_vault("d", "Fourth note")
+            await vault_service.save_transcription_to_vault("e", "Fifth note")
+            assert mock_probe.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_writable_leaves_no_file(self, vault_service, tmp_path):
+        """Test that the startup write probe leaves the vault untouched."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        await vault_service.probe_writable()
+        with patch("app.services.vault._O_TMPFILE", None):
+            await vault_service.probe_writable()
+
+        assert list(vault_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_vault_status_cached_without_write_probe(
+        self, vault_service, tmp_path
+    ):
+        """Test that repeated status polls reuse one check and write nothing."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+
+        with (
+            patch("app.services.vault.os.statvfs", wraps=os.statvfs) as mock_statvfs,
+            patch("app.services.vault.open") as mock_open,
+        ):
+            first = await vault_service.get_vault_status()
+            second = await vault_service.get_vault_status()
+
+        assert first is second
+        assert first["accessible"] is True
+        mock_statvfs.assert_called_once()
+        mock_open.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_filename_generation(self, vault_service):
         """Test filename generation."""
@@ -159,6 +546,22 @@ class TestVaultService:
 
             assert "Vault path not configured" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_handle_duplicate_filename_scans_once(self, vault_service, tmp_path):
+        """Test that suffix resolution reads the directory once, not per candidate."""
+        vault_path = tmp_path / "test_vault"
+        vault_path.mkdir()
+        for name in ["note.md", "note_001.md", "note_002.md", "note_004.md"]:
+            (vault_path / name).touch()
+
+        with patch(
+            "app.services.vault.os.path.exists", wraps=os.path.exists
+        ) as mock_exists:
+            result = vault_service._handle_duplicate_filename_sync("note.md")
+
+        assert result == vault_path / "note_003.md"
+        assert mock_exists.call_count == 1
+
     @pytest.mark.asyncio
     async def test_duplicate_filename_limit(self, vault_service, tmp_path):
         """Test that duplicate filename handling has a reasonable limit."""
@@ -24,7 +24,7 @@ class TestWhisperModelManager:
         assert not manager.is_loading
         assert manager.load_error is None
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_load_model_success(self, mock_load_model):
         """Test successful model loading."""
         mock_model = Mock()
@@ -41,9 +41,39 @@ class TestWhisperModelManager:
         assert manager.is_loaded
         assert not manager.is_loading
         assert manager.load_error is None
-        mock_load_model.assert_called_once()
+        mock_load_model.assert_called_once_with(
+            manager._resolve_model_path(),
+            device=manager._device,
+            compute_type=manager._compute_type,
+            cpu_threads=manager._cpu_threads,
+            num_workers=manager._max_concurrent,
+        )
+
+    def test_resolve_model_path_prefers_local_snapshot(self):
+        """Test that a cached snapshot is loaded without a Hub lookup."""
+        manager = WhisperModelManager()
+
+        with patch(
+            "app.services.whisper_model.download_model",
+            return_value="/cache/faster-whisper-base",
+        ) as mock_download:
+            assert manager._resolve_model_path() == "/cache/faster-whisper-base"
+
+        mock_download.assert_called_once_with(
+            manager._model_size, local_files_only=True
+        )
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    def test_resolve_model_path_not_cached(self):
+        """Test that an uncached model falls back to downloading by name."""
+        manager = WhisperModelManager()
+
+        with patch(
+            "app.services.whisper_model.download_model",
+            side_effect=FileNotFoundError("not cached"),
+        ):
+            assert manager._resolve_model_path() == manager._model_size
+
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_load_model_failure(self, mock_load_model):
         """Test model loading failure."""
         mock_load_model.side_effect = Exception("Model load failed")
@@ -61,7 +91,7 @@ class TestWhisperModelManager:
         assert not manager.is_loading
         assert "Model load failed" in manager.load_error
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_load_model_already_loaded(self, mock_load_model):
         """Test that model is not loaded if already loaded."""
         mock_model = Mock()
@@ -81,21 +111,31 @@ class TestWhisperModelManager:
         with pytest.raises(RuntimeError, match="Whisper model not loaded"):
             await manager.transcribe("test.wav")
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_transcribe_success(self, mock_load_model):
         """Test successful transcription."""
-        mock_result = {
-            "text": "This is a test transcription",
-            "language": "en",
-            "duration": 5.0,
-            "segments": [
-                {"text": "This is a test", "start": 0.0, "end": 2.5},
-                {"text": " transcription", "start": 2.5, "end": 5.0},
-            ],
-        }
+        mock_segments = [
+            Mock(
+                id=0,
+                start=0.0,
+                end=2.5,
+                text="This is a test",
+                avg_logprob=-0.2,
+                no_speech_prob=0.01,
+            ),
+            Mock(
+                id=1,
+                start=2.5,
+                end=5.0,
+                text=" transcription",
+                avg_logprob=-0.4,
+                no_speech_prob=0.02,
+            ),
+        ]
+        mock_info = Mock(language="en", duration=5.0)
 
         mock_model = Mock()
-        mock_model.transcribe.return_value = mock_result
+        mock_model.transcribe.return_value = (iter(mock_segments), mock_info)
         mock_load_model.return_value = mock_model
 
         manager = WhisperModelManager()
@@ -103,16 +143,18 @@ class TestWhisperModelManager:
 
         result = await manager.transcribe("test.wav", language="en")
 
-        assert result == mock_result
+        assert result["text"] == "This is a test transcription"
+        assert result["language"] == "en"
+        assert result["duration"] == 5.0
+        assert [seg["avg_logprob"] for seg in result["segments"]] == [-0.2, -0.4]
         mock_model.transcribe.assert_called_once_with(
-            audio="test.wav",
+            "test.wav",
             language="en",
             task="transcribe",
-            fp16=False,
-            verbose=False,
+            vad_filter=True,
         )
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_transcribe_failure(self, mock_load_model):
         """Test transcription failure."""
         mock_model = Mock()
@@ -125,6 +167,87 @@ class TestWhisperModelManager:
         with pytest.raises(RuntimeError, match="Transcription failed"):
             await manager.transcribe("test.wav")
 
+    async def test_transcribe_runs_off_event_loop(self):
+        """Test that inference and segment decoding run in a worker thread."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        seen_threads = []
+
+        def segments():
+            seen_threads.append(threading.get_ident())
+            yield from ()
+
+        def fake_transcribe(*args, **kwargs):
+            seen_threads.append(threading.get_ident())
+            return segments(), Mock(language="en", duration=0.0)
+
+        mock_model = Mock()
+        mock_model.transcribe.side_effect = fake_transcribe
+
+        manager = WhisperModelManager()
+        manager._model = mock_model
+
+        await manager.transcribe("test.wav")
+
+        assert len(seen_threads) == 2
+        assert loop_thread not in seen_threads
+
+    async def test_transcribe_concurrency_bounded(self):
+        """Test that inference calls beyond the slot count wait their turn."""
+        import asyncio
+        import threading
+        import time
+
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def fake_transcribe(*args, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return iter([]), Mock(language="en", duration=0.0)
+
+        mock_model = Mock()
+        mock_model.transcribe.side_effect = fake_transcribe
+
+        manager = WhisperModelManager()
+        manager._model = mock_model
+        slots = manager._slots
+        manager._slots = asyncio.Semaphore(1)
+
+        try:
+            await asyncio.gather(*(manager.transcribe("test.wav") for _ in range(3)))
+        finally:
+            manager._slots = slots
+
+        assert peak == 1
+        assert mock_model.transcribe.call_count == 3
+
+    async def test_transcribe_vad_filter_disabled(self):
+        """Test that the VAD filter can be switched off."""
+        mock_model = Mock()
+        mock_model.transcribe.return_value = (
+            iter([]),
+            Mock(language="en", duration=0.0),
+        )
+
+        manager = WhisperModelManager()
+        manager._model = mock_model
+        manager._vad_filter = False
+
+        try:
+            await manager.transcribe("test.wav")
+        finally:
+            manager._vad_filter = True
+
+        assert mock_model.transcribe.call_args.kwargs["vad_filter"] is False
+
     def test_get_model_info(self):
         """Test getting model information."""
         manager = WhisperModelManager()
@@ -138,6 +261,7 @@ class TestWhisperModelManager:
             "model_size": manager._model_size,
             "device": manager._device,
             "compute_type": manager._compute_type,
+            "max_concurrent": manager._max_concurrent,
             "is_loaded": False,
             "is_loading": False,
             "load_error": "Test error",
@@ -145,12 +269,14 @@ class TestWhisperModelManager:
 
         assert info == expected_info
 
-    @patch("app.services.whisper_model.whisper.load_model")
+    @patch("app.services.whisper_model.WhisperModel")
     async def test_transcribe_with_custom_params(self, mock_load_model):
         """Test transcription with custom parameters."""
-        mock_result = {"text": "Test", "language": "es"}
         mock_model = Mock()
-        mock_model.transcribe.return_value = mock_result
+        mock_model.transcribe.return_value = (
+            iter([]),
+            Mock(language="es", duration=0.0),
+        )
         mock_load_model.return_value = mock_model
 
         manager = WhisperModelManager()
@@ -158,13 +284,12 @@ class TestWhisperModelManager:
 
         result = await manager.transcribe("test.wav", language="es", task="translate")
 
-        assert result == mock_result
+        assert result == {"text": "", "language": "es", "duration": 0.0, "segments": []}
         mock_model.transcribe.assert_called_once_with(
-            audio="test.wav",
+            "test.wav",
             language="es",
             task="translate",
-            fp16=False,
-            verbose=False,
+            vad_filter=True,
         )
 
     async def test_concurrent_loading(self):
@@ -175,7 +300,7 @@ class TestWhisperModelManager:
         manager._model = None
         manager._loading = False
 
-        with patch("app.services.whisper_model.whisper.load_model") as mock_load:
+        with patch("app.services.whisper_model.WhisperModel") as mock_load:
             mock_load.return_value = Mock()
 
             # Start multiple load operations concurrently
@@ -185,3 +310,80 @@ class TestWhisperModelManager:
             # Model should only be loaded once
             assert mock_load.call_count == 1
             assert manager.is_loaded
+
+    async def test_load_model_waiters_see_loaded_model(self):
+        """Test that callers arriving mid-load return only once it finishes."""
+        import asyncio
+
+        manager = WhisperModelManager()
+        manager._model = None
+        manager._loading = False
+
+        with patch("app.services.whisper_model.WhisperModel") as mock_load:
+            mock_load.return_value = Mock()
+
+            async def waiter():
+                await manager.load_model()
+                return manager.is_loaded
+
+            results = await asyncio.gather(manager.load_model(), waiter(), waiter())
+
+            assert results[1:] == [True, True]
+            assert mock_load.call_count == 1
+
+    async def test_ensure_loaded_loads_once_for_concurrent_callers(self):
+        """Test that waiters share the in-flight load instead of polling."""
+        import asyncio
+
+        manager = WhisperModelManager()
+        manager._model = None
+        manager._loading = False
+
+        with patch("app.services.whisper_model.WhisperModel") as mock_load:
+            mock_load.return_value = Mock()
+
+            await asyncio.gather(*(manager.ensure_loaded() for _ in range(3)))
+
+            assert mock_load.call_count == 1
+            assert manager.is_loaded
+
+    async def test_ensure_loaded_retries_after_failure(self):
+        """Test that a failed load does not leave later callers stuck."""
+        from app.core.exceptions import WhisperError
+
+        manager = WhisperModelManager()
+        manager._model = None
+        manager._loading = False
+
+        with patch("app.services.whisper_model.WhisperModel") as mock_load:
+            mock_load.side_effect = [Exception("boom"), Mock()]
+
+            with pytest.raises(WhisperError):
+                await manager.ensure_loaded()
+
+            await manager.ensure_loaded()
+
+            assert mock_load.call_count == 2
+            assert manager.is_loaded
+
+    async def test_waiters_behind_failed_load_never_see_missing_model(self):
+        """Test that callers queued behind a failed load retry or raise."""
+        import asyncio
+
+        from app.core.exceptions import WhisperError
+
+        manager = WhisperModelManager()
+        manager._model = None
+        manager._loading = False
+
+        with patch("app.services.whisper_model.WhisperModel") as mock_load:
+            mock_load.side_effect = [Exception("boom"), Mock()]
+
+            results = await asyncio.gather(
+                *(manager.ensure_loaded() for _ in range(3)), return_exceptions=True
+            )
+
+            assert isinstance(results[0], WhisperError)
+            assert results[1:] == [None, None]
+            assert mock_load.call_count == 2
+            assert manager.is_loaded
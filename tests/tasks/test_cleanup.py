@@ -0,0 +1,72 @@
+"""Tests for background cleanup tasks."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.tasks import cleanup
+
+
+@pytest.fixture
+def mock_services():
+    """Patch the services the cleanup loop calls."""
+    with (
+        patch.object(cleanup, "session_manager") as mock_sessions,
+        patch.object(cleanup, "transcription_cache") as mock_cache,
+    ):
+        mock_sessions.cleanup_expired_sessions = AsyncMock(return_value=0)
+        mock_cache.purge_expired = AsyncMock(return_value=0)
+        yield mock_sessions, mock_cache
+
+
+class TestCleanupTask:
+    """Test cleanup task scheduling."""
+
+    async def test_start_is_idempotent_and_stop_cancels(self, mock_services):
+        """Test that a running task is reused and stop cancels it."""
+        task = cleanup.start_cleanup_task()
+
+        try:
+            assert cleanup.start_cleanup_task() is task
+        finally:
+            await cleanup.stop_cleanup_task()
+
+        assert task.cancelled()
+        assert cleanup._cleanup_task is None
+
+    async def test_sleep_accounts_for_run_time(self, mock_services):
+        """Test that the next run is scheduled from the start of this one."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            raise asyncio.CancelledError
+
+        with (
+            patch.object(cleanup.settings, "session_cleanup_interval_minutes", 1),
+            patch.object(cleanup.time, "monotonic", side_effect=[100.0, 115.0]),
+            patch.object(cleanup.asyncio, "sleep", fake_sleep),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await cleanup.cleanup_expired_sessions()
+
+        assert sleeps == [45.0]
+
+    async def test_overrun_starts_next_run_immediately(self, mock_services):
+        """Test that a run longer than the interval doesn't sleep at all."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            raise asyncio.CancelledError
+
+        with (
+            patch.object(cleanup.settings, "session_cleanup_interval_minutes", 1),
+            patch.object(cleanup.time, "monotonic", side_effect=[100.0, 200.0]),
+            patch.object(cleanup.asyncio, "sleep", fake_sleep),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await cleanup.cleanup_expired_sessions()
+
+        assert sleeps == [0.0]